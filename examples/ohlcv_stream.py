@@ -12,6 +12,7 @@ What you'll learn:
 - Stopping the stream after N bars
 - Monitoring multiple symbols with get_latest_trade_info()
 - Handling ConnectionClosed with retry/backoff
+- Running the stream on uvloop when it is installed (pip install 'tvkit[fast]')
 
 Prerequisites:
 - Internet connection for TradingView API access
@@ -24,6 +25,7 @@ Usage:
 
 import asyncio
 import traceback
+from collections.abc import Callable
 from typing import Any
 
 from websockets.exceptions import ConnectionClosed
@@ -126,5 +128,15 @@ async def main() -> None:
         traceback.print_exc()
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory when uvloop is installed, else the asyncio default."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        runner.run(main())
@@ -941,7 +941,7 @@ class TestConnectionServiceAuthToken:
 
         auth_error_frame = json.dumps(
             {"m": "critical_error", "p": [{"error_code": "unauthorized_access"}]}
-        )
+        ).encode()
         await svc._message_queue.put(auth_error_frame)
 
         with pytest.raises(ChartAuthError):
@@ -957,7 +957,7 @@ class TestConnectionServiceAuthToken:
 
         auth_error_frame = json.dumps(
             {"m": "set_auth_token", "p": [{"error": "unauthorized_access"}]}
-        )
+        ).encode()
         await svc._message_queue.put(auth_error_frame)
 
         mock_cookie_provider = MagicMock()
@@ -1549,7 +1549,7 @@ class TestOHLCVSessionWiring:
 
         auth_error_frame = json.dumps(
             {"m": "critical_error", "p": [{"error_code": "unauthorized_access"}]}
-        )
+        ).encode()
         await svc._message_queue.put(auth_error_frame)
 
         with pytest.raises(ChartAuthError):
@@ -1565,7 +1565,7 @@ class TestOHLCVSessionWiring:
 
         auth_error_frame = json.dumps(
             {"m": "set_auth_token", "p": [{"error": "unauthorized_access"}]}
-        )
+        ).encode()
         await svc._message_queue.put(auth_error_frame)
 
         mock_cp = MagicMock()
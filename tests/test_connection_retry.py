@@ -84,7 +84,7 @@ def test_drain_queue_clears_stale_messages() -> None:
     """_drain_queue() removes all pending items."""
     svc = make_service()
     for i in range(5):
-        svc._message_queue.put_nowait(f"item-{i}")
+        svc._message_queue.put_nowait(f"item-{i}".encode())
     assert svc._message_queue.qsize() == 5
     svc._drain_queue()
     assert svc._message_queue.empty()
@@ -139,6 +139,77 @@ async def test_reader_sentinel_placed_on_clean_exit() -> None:
     assert sentinel is _SENTINEL
 
 
+async def _frames_async_iter(*frames: str | bytes) -> AsyncIterator[str | bytes]:
+    """Async generator that yields the given frames, then ends."""
+    for frame in frames:
+        yield frame
+
+
+@pytest.mark.asyncio
+async def test_reader_enqueues_bytes_frames_undecoded() -> None:
+    """Data frames are queued as received; decoding is left to the consumer."""
+    svc = make_service()
+    svc._state = ConnectionState.STREAMING
+
+    frame = b'~m~23~m~{"m":"du","p":[]}'
+    mock_ws = MagicMock()
+    mock_ws.__aiter__ = lambda self: _frames_async_iter(frame)
+    mock_ws.send = AsyncMock()
+    svc._ws = mock_ws
+
+    await svc._read_raw_loop()
+
+    assert svc._message_queue.get_nowait() == frame
+    assert svc._message_queue.get_nowait() is _SENTINEL
+    mock_ws.send.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("heartbeat", ["~m~4~m~~h~1", b"~m~4~m~~h~1", b"~m~9~m~~h~1234567"])
+async def test_reader_echoes_heartbeat_unchanged(heartbeat: str | bytes) -> None:
+    """Heartbeats are echoed back as undecoded text frames and never queued."""
+    svc = make_service()
+    svc._state = ConnectionState.STREAMING
+
+    mock_ws = MagicMock()
+    mock_ws.__aiter__ = lambda self: _frames_async_iter(heartbeat)
+    mock_ws.send = AsyncMock()
+    svc._ws = mock_ws
+
+    await svc._read_raw_loop()
+
+    expected: bytes = heartbeat.encode() if isinstance(heartbeat, str) else heartbeat
+    mock_ws.send.assert_awaited_once_with(expected, text=True)
+    assert svc._message_queue.get_nowait() is _SENTINEL
+
+
+@pytest.mark.asyncio
+async def test_consumer_parses_bytes_frames() -> None:
+    """get_data_stream() splits and parses bytes frames without decoding them first."""
+    svc = make_service()
+    svc._message_queue.put_nowait(b'~m~23~m~{"m":"du","p":[]}')
+
+    with patch.object(svc, "close", new_callable=AsyncMock):
+        svc._ws = MagicMock()
+        items = await drain(svc.get_data_stream(), limit=1)
+
+    assert items == [{"m": "du", "p": []}]
+
+
+@pytest.mark.asyncio
+async def test_iter_payloads_yields_unparsed_records() -> None:
+    """_iter_payloads() yields each record's raw bytes and stops on a clean close."""
+    svc = make_service()
+    svc._ws = MagicMock()
+    svc._closing = True
+    svc._message_queue.put_nowait(b'~m~23~m~{"m":"du","p":[]}~m~13~m~{"m":"qsd"}')
+    svc._message_queue.put_nowait(None)
+
+    payloads = [bytes(item) async for item in svc._iter_payloads()]
+
+    assert payloads == [b'{"m":"du","p":[]}', b'{"m":"qsd"}']
+
+
 # ---------------------------------------------------------------------------
 # _reset_connection
 # ---------------------------------------------------------------------------
@@ -185,7 +256,7 @@ async def test_reset_connection_drains_queue() -> None:
     svc._ws = None
 
     for i in range(10):
-        svc._message_queue.put_nowait(f"msg-{i}")
+        svc._message_queue.put_nowait(f"msg-{i}".encode())
     assert svc._message_queue.qsize() == 10
 
     await svc._reset_connection()
@@ -202,7 +273,7 @@ async def test_reconnect_on_unexpected_close() -> None:
     """None sentinel (not _closing) triggers reconnect; stream resumes after."""
     svc = make_service(max_attempts=3, base_backoff=0.01, max_backoff=0.01)
 
-    frame = '~m~23~m~{"m":"du","p":[]}'
+    frame = b'~m~23~m~{"m":"du","p":[]}'
     svc._message_queue.put_nowait(_SENTINEL)
     svc._message_queue.put_nowait(frame)
 
@@ -363,7 +434,7 @@ async def test_reconnect_storm_single_loop() -> None:
     svc._message_queue.put_nowait(_SENTINEL)
     svc._message_queue.put_nowait(_SENTINEL)
     svc._message_queue.put_nowait(_SENTINEL)
-    svc._message_queue.put_nowait('{"m":"done"}')
+    svc._message_queue.put_nowait(b'{"m":"done"}')
 
     with patch.object(svc, "_reconnect_with_backoff", side_effect=counting_reconnect):
         with patch.object(svc, "close", new_callable=AsyncMock):
@@ -457,14 +528,14 @@ async def test_queue_blocks_on_full() -> None:
 
     # Fill queue to capacity using the service's own maxsize
     for _ in range(svc._message_queue.maxsize):
-        svc._message_queue.put_nowait("x")
+        svc._message_queue.put_nowait(b"x")
 
     # put_nowait raises immediately on full queue
     with pytest.raises(asyncio.QueueFull):
-        svc._message_queue.put_nowait("overflow")
+        svc._message_queue.put_nowait(b"overflow")
 
     # Blocking await put() should block (not complete) until space is freed
-    task = asyncio.create_task(svc._message_queue.put("new-item"))
+    task = asyncio.create_task(svc._message_queue.put(b"new-item"))
     await asyncio.sleep(0)  # yield to let the task attempt
     assert not task.done(), "put() must block when queue is full"
     task.cancel()
@@ -472,3 +543,29 @@ async def test_queue_blocks_on_full() -> None:
         await task
     except asyncio.CancelledError:
         pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_orjson", [True, False])
+async def test_consumer_parses_frames_with_and_without_orjson(
+    use_orjson: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Frames parse identically with orjson and with the stdlib fallback."""
+    from tvkit.api.chart.services import connection_service
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(connection_service, "orjson", None)
+
+    body = '{"m":"qsd","p":["qs_1",{"n":"X","v":{"lp":NaN,"ch":1.5}}]}'
+    svc = make_service()
+    svc._message_queue.put_nowait(f"~m~{len(body)}~m~{body}".encode())
+
+    with patch.object(svc, "close", new_callable=AsyncMock):
+        svc._ws = MagicMock()
+        items = await drain(svc.get_data_stream(), limit=1)
+
+    assert items[0]["m"] == "qsd"
+    assert items[0]["p"][1]["v"]["ch"] == 1.5
+    assert items[0]["p"][1]["v"]["lp"] != items[0]["p"][1]["v"]["lp"]  # NaN
@@ -3,7 +3,7 @@
 import inspect
 import json
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -139,6 +139,42 @@ class TestAddMultipleSymbolsToSessions:
             assert symbol in second_call_args
 
 
+class TestAddSeriesToSessions:
+    """Tests for add_series_to_sessions (additional series on one chart session)."""
+
+    @pytest.mark.asyncio
+    async def test_uses_indexed_series_identifiers(self) -> None:
+        """Series N is created as sds_N / sN referencing sds_sym_N, without a study."""
+        sent_messages: list[tuple[str, list[Any]]] = []
+
+        async def mock_send(method: str, args: list[Any]) -> None:
+            sent_messages.append((method, args))
+
+        svc: ConnectionService = ConnectionService(ws_url=WS_URL)
+        await svc.add_series_to_sessions(
+            "qs_test", "cs_test", "NASDAQ:MSFT", "1D", 50, 3, send_message_func=mock_send
+        )
+
+        resolve: str = (
+            '={"adjustment": "splits", "backadjustment": "default", "symbol": "NASDAQ:MSFT"}'
+        )
+        assert sent_messages == [
+            ("quote_add_symbols", ["qs_test", resolve]),
+            ("resolve_symbol", ["cs_test", "sds_sym_3", resolve]),
+            ("create_series", ["cs_test", "sds_3", "s3", "sds_sym_3", "1D", 50, ""]),
+            ("quote_fast_symbols", ["qs_test", "NASDAQ:MSFT"]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rejects_first_series_index(self) -> None:
+        """Series 1 belongs to add_symbol_to_sessions and cannot be added again."""
+        svc: ConnectionService = ConnectionService(ws_url=WS_URL)
+        with pytest.raises(ValueError, match="series_index"):
+            await svc.add_series_to_sessions(
+                "qs_test", "cs_test", "NASDAQ:MSFT", "1D", 50, 1, send_message_func=AsyncMock()
+            )
+
+
 class TestAuthTokenParameter:
     """Tests for ConnectionService auth_token constructor parameter and initialize_sessions."""
 
@@ -285,8 +321,8 @@ class TestAuthErrorDetection:
                 "p": [{"error_code": "unauthorized_access"}],
             }
         )
-        # _message_queue holds raw TradingView-framed strings (as written by _read_raw_loop)
-        framed: str = f"~m~{len(auth_json)}~m~{auth_json}"
+        # _message_queue holds raw TradingView-framed bytes (as written by _read_raw_loop)
+        framed: bytes = f"~m~{len(auth_json)}~m~{auth_json}".encode()
         await svc._message_queue.put(framed)
 
         with pytest.raises(AuthError):
@@ -309,7 +345,7 @@ class TestAuthErrorDetection:
                 "p": [{"error": "session_expired"}],
             }
         )
-        framed: str = f"~m~{len(auth_json)}~m~{auth_json}"
+        framed: bytes = f"~m~{len(auth_json)}~m~{auth_json}".encode()
         await svc._message_queue.put(framed)
 
         with pytest.raises(AuthError):
@@ -363,6 +399,23 @@ class TestAuthErrorDetection:
         assert payload["adjustment"] == "dividends"
         assert payload["backadjustment"] == "default"
 
+    @pytest.mark.asyncio
+    async def test_resolve_symbol_matches_json_dumps(self) -> None:
+        """The templated resolve_symbol payload is identical to json.dumps of the dict."""
+        sent: list[tuple[str, list[Any]]] = []
+
+        async def mock_send(m: str, p: list[Any]) -> None:
+            sent.append((m, p))
+
+        symbol = 'NASDAQ:"A\\B'
+        svc = ConnectionService(ws_url=WS_URL)
+        await svc.add_symbol_to_sessions("qs_t", "cs_t", symbol, "1D", 100, mock_send)
+        resolve_args = next(p for m, p in sent if m == "resolve_symbol")
+        expected = json.dumps(
+            {"adjustment": "splits", "backadjustment": "default", "symbol": symbol}
+        )
+        assert resolve_args[2] == f"={expected}"
+
     def test_add_symbol_to_sessions_default_adjustment_is_splits(self) -> None:
         """Default value of adjustment parameter must be Adjustment.SPLITS."""
         from tvkit.api.chart.models.adjustment import Adjustment
@@ -402,3 +455,69 @@ class TestAuthErrorDetection:
         from tvkit.api.chart import AuthError as PublicAuthError
 
         assert PublicAuthError is AuthError
+
+
+class TestOpenWebSocket:
+    """Tests for the connect() arguments used by _open_websocket()."""
+
+    @pytest.mark.asyncio
+    async def test_open_websocket_uses_raw_frame_connection(self) -> None:
+        """Frames are received undecoded and the message size stays unlimited."""
+        from tvkit.api.chart.services.connection_service import _RawFrameClientConnection
+
+        svc: ConnectionService = ConnectionService(ws_url=WS_URL)
+        connect_mock = AsyncMock(return_value=MagicMock())
+        with patch("tvkit.api.chart.services.connection_service.connect", connect_mock):
+            await svc._open_websocket()
+
+        kwargs = connect_mock.call_args.kwargs
+        assert kwargs["create_connection"] is _RawFrameClientConnection
+        assert kwargs["max_size"] is None
+        assert svc.ws is connect_mock.return_value
+
+
+class TestIterFrames:
+    """Tests for the _iter_frames record scanner."""
+
+    @staticmethod
+    def frames(buf: bytes) -> list[bytes]:
+        from tvkit.api.chart.services.connection_service import _iter_frames
+
+        return [bytes(view) for view in _iter_frames(buf)]
+
+    def test_single_record(self) -> None:
+        """A single record yields its payload."""
+        assert self.frames(b'~m~23~m~{"m":"du","p":[]}') == [b'{"m":"du","p":[]}']
+
+    def test_multiple_records(self) -> None:
+        """Concatenated records are yielded in order."""
+        first: bytes = b'{"m":"du","p":[1]}'
+        second: bytes = b'{"m":"qsd","p":[]}'
+        buf: bytes = b"~m~%d~m~%s~m~%d~m~%s" % (len(first), first, len(second), second)
+        assert self.frames(buf) == [first, second]
+
+    def test_non_ascii_payload_with_js_length(self) -> None:
+        """A JS (UTF-16) declared length shorter than the byte length still splits correctly."""
+        first: bytes = '{"n":"ราคา"}'.encode()
+        second: bytes = b'{"m":"du"}'
+        js_length: int = len('{"n":"ราคา"}')
+        buf: bytes = b"~m~%d~m~%s~m~%d~m~%s" % (js_length, first, len(second), second)
+        assert self.frames(buf) == [first, second]
+
+    def test_payload_containing_delimiter_uses_declared_length(self) -> None:
+        """A payload containing ~m~ is kept whole when its declared length is exact."""
+        payload: bytes = b'{"t":"a~m~b"}'
+        buf: bytes = b"~m~%d~m~%s" % (len(payload), payload)
+        assert self.frames(buf) == [payload]
+
+    def test_empty_payload_is_skipped(self) -> None:
+        """Zero-length records produce no payload."""
+        assert self.frames(b'~m~0~m~~m~10~m~{"m":"du"}') == [b'{"m":"du"}']
+
+    def test_unframed_text_is_yielded(self) -> None:
+        """Text outside a record header is yielded so JSON parsing can reject it."""
+        assert self.frames(b'junk~m~10~m~{"m":"du"}') == [b"junk", b'{"m":"du"}']
+
+    def test_empty_buffer(self) -> None:
+        """An empty message yields nothing."""
+        assert self.frames(b"") == []
@@ -7,7 +7,9 @@ including data exporters, formatters, and configuration models.
 
 import json
 import tempfile
-from datetime import datetime
+import threading
+from datetime import date, datetime
+from decimal import Decimal
 from pathlib import Path
 from typing import Any
 
@@ -161,6 +163,146 @@ class TestJSONFormatter:
             assert data["data"][0]["name"] == "AAPL"
             assert data["data"][0]["market"] == "NASDAQ"
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    async def test_json_export_matches_stdlib_encoding(
+        self, use_orjson: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """orjson and the stdlib fallback write the same document for non-native values."""
+        from tvkit.export.formatters import json_formatter
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(json_formatter, "orjson", None)
+
+        payload: dict[str, Any] = {
+            "name": "ตลาด",
+            "price": Decimal("1.10"),
+            "listed": datetime(2024, 1, 2, 3, 4, 5),
+            "big": 2**70,
+        }
+        config: ExportConfig = ExportConfig(format=ExportFormat.JSON)
+        formatter: JSONFormatter = JSONFormatter(config)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path: Path = Path(temp_dir) / "nested" / "out.json"
+            await formatter._write_json_file(payload, file_path)
+            written: str = file_path.read_text(encoding="utf-8")
+
+        assert json.loads(written) == json.loads(json.dumps(payload, default=str))
+        assert "ตลาด" in written
+
+    def test_json_indent_other_than_two_uses_stdlib(self) -> None:
+        """Options orjson cannot honour fall back to json.dumps output."""
+        from tvkit.export.formatters.json_formatter import _dumps_json
+
+        payload: dict[str, Any] = {"b": 1, "a": ["é"]}
+
+        assert _dumps_json(payload, 4, True, True) == json.dumps(
+            payload, indent=4, ensure_ascii=True, sort_keys=True
+        ).encode("utf-8")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("indent", [2, None])
+    async def test_json_stdlib_fallback_matches_json_dumps(
+        self, indent: int | None, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without orjson the incrementally encoded file equals json.dumps output."""
+        from tvkit.export.formatters import json_formatter
+
+        monkeypatch.setattr(json_formatter, "orjson", None)
+        payload: dict[str, Any] = {"data": [{"b": 1.5, "a": "ตลาด"}] * 3, "when": date(2024, 1, 2)}
+        config: ExportConfig = ExportConfig(format=ExportFormat.JSON, options={"indent": indent})
+        formatter: JSONFormatter = JSONFormatter(config)
+
+        await formatter._write_json_file(payload, tmp_path / "out.json")
+
+        assert (tmp_path / "out.json").read_text(encoding="utf-8") == json.dumps(
+            payload,
+            indent=indent,
+            separators=(",", ":") if indent is None else None,
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("options", [{}, {"indent": 4, "sort_keys": False}, {"indent": None}])
+    async def test_json_export_ohlcv_streams_same_document(
+        self, sample_ohlcv_data: list[OHLCVExportData], options: dict[str, Any]
+    ) -> None:
+        """Records written one at a time give the same file as dumping the whole document."""
+        config: ExportConfig = ExportConfig(format=ExportFormat.JSON, options=options)
+        formatter: JSONFormatter = JSONFormatter(config)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            streamed_path: Path = Path(temp_dir) / "streamed.json"
+            await formatter.export_ohlcv(sample_ohlcv_data, streamed_path)
+            streamed: str = streamed_path.read_text(encoding="utf-8")
+
+            document: dict[str, Any] = {
+                "data": [formatter._convert_ohlcv_to_dict(item) for item in sample_ohlcv_data],
+                "metadata": json.loads(streamed)["metadata"],
+            }
+            dumped_path: Path = Path(temp_dir) / "dumped.json"
+            await formatter._write_json_file(document, dumped_path)
+
+            assert streamed == dumped_path.read_text(encoding="utf-8")
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_compact_output_has_no_separator_spaces(
+        self, use_orjson: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """indent=None writes the same minimal document with or without orjson."""
+        from tvkit.export.formatters import json_formatter
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(json_formatter, "orjson", None)
+
+        payload: dict[str, Any] = {"data": [{"open": 1.5, "close": 2.0}], "count": 1}
+
+        assert json_formatter._dumps_json(payload, None, False, True) == (
+            b'{"count":1,"data":[{"close":2.0,"open":1.5}]}'
+        )
+
+    def test_generated_file_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Default paths are <type>_<symbol>_<local timestamp>.<ext>, under export/ if present."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("time.strftime", lambda fmt: "20240102-030405")
+        formatter: JSONFormatter = JSONFormatter(ExportConfig(format=ExportFormat.JSON))
+
+        assert formatter._generate_file_path("ohlcv", "AAPL", "json") == Path(
+            "ohlcv_AAPL_20240102-030405.json"
+        )
+
+        (tmp_path / "export").mkdir()
+        assert formatter._generate_file_path("ohlcv", "AAPL", "json") == Path(
+            "export/ohlcv_AAPL_20240102-030405.json"
+        )
+
+    @pytest.mark.asyncio
+    async def test_json_file_is_written_off_the_event_loop(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Encoding and writing happen in a worker thread, not on the loop's thread."""
+        writer_threads: list[threading.Thread] = []
+        write_bytes = Path.write_bytes
+
+        def recording_write_bytes(path: Path, data: bytes) -> int:
+            writer_threads.append(threading.current_thread())
+            return write_bytes(path, data)
+
+        monkeypatch.setattr(Path, "write_bytes", recording_write_bytes)
+        formatter: JSONFormatter = JSONFormatter(ExportConfig(format=ExportFormat.JSON))
+
+        await formatter._write_json_file({"data": []}, tmp_path / "out.json")
+
+        assert writer_threads and writer_threads[0] is not threading.current_thread()
+        assert json.loads((tmp_path / "out.json").read_text()) == {"data": []}
+
 
 class TestCSVFormatter:
     """Test CSV export formatter."""
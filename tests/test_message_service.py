@@ -0,0 +1,146 @@
+"""Unit tests for MessageService message construction and sending."""
+
+import json
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tvkit.api.chart.services.message_service import MessageService
+
+
+def make_service() -> tuple[MessageService, AsyncMock]:
+    """Return a MessageService bound to a mocked WebSocket."""
+    ws: AsyncMock = AsyncMock()
+    return MessageService(ws), ws
+
+
+class TestConstructMessage:
+    """Tests for construct_message and create_message framing."""
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            [],
+            ["cs_abc", "sds_1", "s1", "sds_sym_1", "1D", 100, ""],
+            ["qs_abc", '={"adjustment": "splits", "symbol": "NASDAQ:AAPL"}'],
+            ["cs_abc", "st1", {"length": 20, "col_prev_close": "false"}],
+            ["qs_abc", "ราคา", None, True, 1.5],
+        ],
+    )
+    def test_construct_message_matches_json_dumps(self, params: list[Any]) -> None:
+        """The envelope is identical to compact json.dumps of the equivalent dict."""
+        svc, _ = make_service()
+        expected: str = json.dumps({"m": "create_series", "p": params}, separators=(",", ":"))
+        assert svc.construct_message("create_series", params) == expected
+
+    @pytest.mark.parametrize(
+        ("func", "params"),
+        [
+            ("set_locale", ["en", "US"]),
+            ("quote_hibernate_all", []),
+            ("quote_add_symbols", ["qs_abc", "ราคา"]),
+        ],
+    )
+    def test_create_message_prepends_length_header(self, func: str, params: list[Any]) -> None:
+        """create_message frames the body as ~m~<len>~m~<body>."""
+        svc, _ = make_service()
+        body: str = svc.construct_message(func, params)
+        assert svc.create_message(func, params) == f"~m~{len(body)}~m~{body}"
+        assert svc.create_message(func, params) == svc.prepend_header(body)
+
+    @pytest.mark.parametrize(
+        ("func", "params"),
+        [
+            ("set_locale", ["en", "US"]),
+            ("quote_add_symbols", ["qs_abc", '={"symbol": "SET:PTT"}']),
+            ("quote_add_symbols", ["qs_abc", "ราคา"]),
+        ],
+    )
+    def test_encode_message_matches_create_message(self, func: str, params: list[Any]) -> None:
+        """The bytes frame is the UTF-8 encoding of create_message(), header included."""
+        svc, _ = make_service()
+        assert svc._encode_message(func, params) == svc.create_message(func, params).encode()
+
+    def test_function_name_is_json_escaped(self) -> None:
+        """A quote or non-ASCII character in the function name cannot break the envelope."""
+        svc, _ = make_service()
+        framed: str = svc.create_message('odd"ราคา', [])
+        body: str = framed.split("~m~", 2)[2]
+        assert json.loads(body) == {"m": 'odd"ราคา', "p": []}
+        assert framed == svc.prepend_header(body)
+
+
+class TestSendMessage:
+    """Tests for send_message."""
+
+    @pytest.mark.asyncio
+    async def test_send_message_sends_framed_message(self) -> None:
+        """send_message sends the framed message over the WebSocket."""
+        svc, ws = make_service()
+        await svc.send_message("quote_hibernate_all", ["qs_abc"])
+        ws.send.assert_awaited_once_with(
+            svc.create_message("quote_hibernate_all", ["qs_abc"]).encode(), text=True
+        )
+
+
+class TestQueueAndFlush:
+    """Tests for queue_message and flush batching."""
+
+    @pytest.mark.asyncio
+    async def test_queue_message_does_not_send(self) -> None:
+        """Queued messages are held until flush()."""
+        svc, ws = make_service()
+        await svc.queue_message("set_locale", ["en", "US"])
+        ws.send.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_flush_sends_queued_messages_in_one_call(self) -> None:
+        """flush() concatenates queued frames, in order, into a single send."""
+        svc, ws = make_service()
+        await svc.queue_message("set_locale", ["en", "US"])
+        await svc.queue_message("quote_hibernate_all", ["qs_abc"])
+
+        await svc.flush()
+
+        ws.send.assert_awaited_once_with(
+            (
+                svc.create_message("set_locale", ["en", "US"])
+                + svc.create_message("quote_hibernate_all", ["qs_abc"])
+            ).encode(),
+            text=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_flush_clears_queue(self) -> None:
+        """A second flush() with nothing queued sends nothing."""
+        svc, ws = make_service()
+        await svc.queue_message("quote_hibernate_all", ["qs_abc"])
+        await svc.flush()
+        await svc.flush()
+        assert ws.send.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_with_empty_queue_is_noop(self) -> None:
+        """flush() without queued messages does not touch the WebSocket."""
+        svc, ws = make_service()
+        await svc.flush()
+        ws.send.assert_not_awaited()
+
+
+class TestGenerateSession:
+    """Tests for generate_session."""
+
+    def test_generate_session_appends_12_hex_chars(self) -> None:
+        """The identifier is the prefix followed by 12 lowercase hex characters."""
+        svc, _ = make_service()
+        session: str = svc.generate_session("qs_")
+        assert session.startswith("qs_")
+        suffix: str = session[len("qs_") :]
+        assert len(suffix) == 12
+        assert all(ch in "0123456789abcdef" for ch in suffix)
+
+    def test_generate_session_is_random(self) -> None:
+        """Successive identifiers differ."""
+        svc, _ = make_service()
+        assert svc.generate_session("cs_") != svc.generate_session("cs_")
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import FrozenInstanceError
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
@@ -118,7 +118,8 @@ class TestRestoreSession:
 
         mock_ms = MagicMock()
         mock_send = AsyncMock()
-        mock_ms.get_send_message_callable.return_value = mock_send
+        mock_ms.queue_message = mock_send
+        mock_ms.flush = AsyncMock()
 
         client.connection_service = mock_cs
 
@@ -140,6 +141,8 @@ class TestRestoreSession:
             range_param="",
             adjustment=Adjustment.SPLITS,
         )
+        # The whole setup burst is delivered with a single flush.
+        mock_ms.flush.assert_awaited_once_with()
 
     @pytest.mark.asyncio
     async def test_range_param_passed(self) -> None:
@@ -160,7 +163,8 @@ class TestRestoreSession:
 
         mock_ms = MagicMock()
         mock_send = AsyncMock()
-        mock_ms.get_send_message_callable.return_value = mock_send
+        mock_ms.queue_message = mock_send
+        mock_ms.flush = AsyncMock()
         client.connection_service = mock_cs
 
         with patch("tvkit.api.chart.ohlcv.MessageService", return_value=mock_ms):
@@ -179,6 +183,56 @@ class TestRestoreSession:
             adjustment=Adjustment.SPLITS,
         )
 
+    @pytest.mark.asyncio
+    async def test_extra_symbols_replayed_as_further_series(self) -> None:
+        """_restore_session re-adds get_ohlcv_multi() symbols as series 2, 3, ..."""
+        client = OHLCV()
+        client._session = _StreamingSession(
+            symbol="NASDAQ:AAPL",
+            interval="1D",
+            bars_count=100,
+            quote_session="qs_abc",
+            chart_session="cs_abc",
+            extra_symbols=("NASDAQ:MSFT", "NYSE:IBM"),
+        )
+
+        mock_cs = AsyncMock()
+        mock_cs.ws = MagicMock()
+        mock_ms = MagicMock()
+        mock_send = AsyncMock()
+        mock_ms.queue_message = mock_send
+        mock_ms.flush = AsyncMock()
+        client.connection_service = mock_cs
+
+        with patch("tvkit.api.chart.ohlcv.MessageService", return_value=mock_ms):
+            await client._restore_session()
+
+        from tvkit.api.chart.models.adjustment import Adjustment
+
+        assert mock_cs.add_series_to_sessions.await_args_list == [
+            call(
+                "qs_abc",
+                "cs_abc",
+                "NASDAQ:MSFT",
+                "1D",
+                100,
+                2,
+                mock_send,
+                adjustment=Adjustment.SPLITS,
+            ),
+            call(
+                "qs_abc",
+                "cs_abc",
+                "NYSE:IBM",
+                "1D",
+                100,
+                3,
+                mock_send,
+                adjustment=Adjustment.SPLITS,
+            ),
+        ]
+        mock_ms.flush.assert_awaited_once_with()
+
     @pytest.mark.asyncio
     async def test_propagates_exception(self) -> None:
         """_restore_session re-raises exceptions so ConnectionService retry loop can react."""
@@ -197,7 +251,8 @@ class TestRestoreSession:
         mock_cs.initialize_sessions.side_effect = OSError("Network error")
 
         mock_ms = MagicMock()
-        mock_ms.get_send_message_callable.return_value = AsyncMock()
+        mock_ms.queue_message = AsyncMock()
+        mock_ms.flush = AsyncMock()
         client.connection_service = mock_cs
 
         with patch("tvkit.api.chart.ohlcv.MessageService", return_value=mock_ms):
@@ -275,7 +330,8 @@ class TestSessionTracking:
 
         mock_ms = MagicMock()
         mock_ms.generate_session.side_effect = ["qs_test123", "cs_test456"]
-        mock_ms.get_send_message_callable.return_value = AsyncMock()
+        mock_ms.queue_message = AsyncMock()
+        mock_ms.flush = AsyncMock()
 
         with (
             patch("tvkit.api.chart.ohlcv.ConnectionService", return_value=mock_cs),
@@ -291,6 +347,45 @@ class TestSessionTracking:
         assert client._session.chart_session == "cs_test456"
         assert client._session.range_param == ""
 
+    @pytest.mark.asyncio
+    async def test_prepare_sends_setup_burst_in_one_websocket_message(self) -> None:
+        """Session setup is delivered as one WebSocket message holding every record."""
+        import json
+
+        from tvkit.api.chart.services.connection_service import ConnectionService, _iter_frames
+
+        client = OHLCV()
+        ws = AsyncMock()
+        real_cs = ConnectionService("wss://test.example.com/ws")
+
+        async def fake_connect() -> None:
+            real_cs._ws = ws
+
+        with (
+            patch("tvkit.api.chart.ohlcv.ConnectionService", return_value=real_cs),
+            patch.object(real_cs, "connect", side_effect=fake_connect),
+        ):
+            await client._prepare_chart_session("NASDAQ:AAPL", "1D", 100)
+
+        ws.send.assert_awaited_once()
+        assert ws.send.await_args.kwargs == {"text": True}
+        message: bytes = ws.send.await_args.args[0]
+        methods = [json.loads(bytes(p))["m"] for p in _iter_frames(message)]
+        assert methods == [
+            "set_auth_token",
+            "set_locale",
+            "chart_create_session",
+            "quote_create_session",
+            "quote_set_fields",
+            "quote_hibernate_all",
+            "quote_add_symbols",
+            "resolve_symbol",
+            "create_series",
+            "quote_fast_symbols",
+            "create_study",
+            "quote_hibernate_all",
+        ]
+
     @pytest.mark.asyncio
     async def test_session_range_param_stored(self) -> None:
         """_prepare_chart_session stores range_param when provided."""
@@ -303,7 +398,8 @@ class TestSessionTracking:
 
         mock_ms = MagicMock()
         mock_ms.generate_session.side_effect = ["qs_test123", "cs_test456"]
-        mock_ms.get_send_message_callable.return_value = AsyncMock()
+        mock_ms.queue_message = AsyncMock()
+        mock_ms.flush = AsyncMock()
 
         with (
             patch("tvkit.api.chart.ohlcv.ConnectionService", return_value=mock_cs),
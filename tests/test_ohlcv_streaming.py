@@ -0,0 +1,405 @@
+"""
+Tests for the real-time streaming generators of the OHLCV client.
+
+Covers message dispatch in get_ohlcv(), get_ohlcv_batches(), get_ohlcv_multi() and
+get_quote_data(): which frames are turned into models and yielded, and which are only
+logged or skipped.
+No real network calls — all external I/O is mocked.
+"""
+
+import logging
+from collections.abc import AsyncGenerator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tvkit.api.chart.models.ohlcv import OHLCVBar, QuoteSymbolData
+from tvkit.api.chart.ohlcv import OHLCV
+
+SYMBOL: str = "BINANCE:BTCUSDT"
+
+QSD_MSG: dict[str, Any] = {
+    "m": "qsd",
+    "p": ["qs_xxx", {"n": SYMBOL, "s": "ok", "v": {"lp": 42000.5, "ch": 1.5}}],
+}
+QUOTE_COMPLETED_MSG: dict[str, Any] = {"m": "quote_completed", "p": ["qs_xxx", SYMBOL]}
+
+
+def make_timescale_update(bars_count: int, base_ts: float = 1_000_000.0) -> dict[str, Any]:
+    """Build a fake timescale_update message containing `bars_count` bars."""
+    series: list[dict[str, Any]] = [
+        {"i": i, "v": [base_ts + i * 60, 100.0, 105.0, 95.0, 102.0, float(i + 1)]}
+        for i in range(bars_count)
+    ]
+    return {"m": "timescale_update", "p": ["cs_xxx", {"sds_1": {"s": series}}]}
+
+
+def make_du_update(base_ts: float = 2_000_000.0) -> dict[str, Any]:
+    """Build a fake 'du' data-update message containing one bar."""
+    return {
+        "m": "du",
+        "p": [
+            "cs_xxx",
+            {
+                "sds_1": {
+                    "s": [{"i": 0, "v": [base_ts, 110.0, 115.0, 108.0, 112.0, 1.0]}],
+                    "ns": {"d": "", "indexes": "nochange"},
+                    "t": "s1",
+                    "lbs": {"bar_close_time": base_ts + 60},
+                }
+            },
+        ],
+    }
+
+
+async def fake_stream(
+    messages: list[dict[str, Any]],
+) -> AsyncGenerator[dict[str, Any], None]:
+    """Async generator that yields a pre-defined sequence of messages."""
+    for msg in messages:
+        yield msg
+
+
+def make_patches() -> dict[str, Any]:
+    """Return fresh mock instances for module-level dependencies (per-test isolation)."""
+    return {
+        "validate_symbols": AsyncMock(return_value=True),
+        "normalize_symbol": MagicMock(return_value=SYMBOL),
+        "validate_interval": MagicMock(),
+    }
+
+
+def _make_client(messages: list[dict[str, Any]]) -> OHLCV:
+    """Return an OHLCV client wired to a fake data stream with services mocked."""
+    client: OHLCV = OHLCV()
+    client._prepare_chart_session = AsyncMock()  # type: ignore[method-assign]
+    client.connection_service = MagicMock()
+    client.connection_service.get_data_stream = lambda: fake_stream(messages)
+    client.connection_service.close = AsyncMock()
+    return client
+
+
+async def _collect(stream: AsyncGenerator[Any, None]) -> list[Any]:
+    """Exhaust an async generator into a list."""
+    return [item async for item in stream]
+
+
+class TestGetOhlcvDispatch:
+    """Message dispatch in get_ohlcv()."""
+
+    @pytest.mark.asyncio
+    async def test_yields_bars_from_timescale_and_du(self) -> None:
+        """Bars from timescale_update and du frames are yielded in order."""
+        client = _make_client([make_timescale_update(2), QSD_MSG, make_du_update()])
+
+        with patch.multiple("tvkit.api.chart.ohlcv", **make_patches()):
+            bars: list[OHLCVBar] = await _collect(client.get_ohlcv(SYMBOL, "1", 2))
+
+        assert [bar.timestamp for bar in bars] == [1_000_000.0, 1_000_060.0, 2_000_000.0]
+        assert all(isinstance(bar, OHLCVBar) for bar in bars)
+
+    @pytest.mark.asyncio
+    async def test_qsd_frames_are_not_validated(self) -> None:
+        """qsd frames are only logged, so no QuoteSymbolData model is built for them."""
+        client = _make_client([QSD_MSG, make_du_update()])
+
+        with (
+            patch.multiple("tvkit.api.chart.ohlcv", **make_patches()),
+            patch("tvkit.api.chart.ohlcv._QSD_VALIDATOR") as qsd_validator,
+        ):
+            bars: list[OHLCVBar] = await _collect(client.get_ohlcv(SYMBOL, "1", 1))
+
+        qsd_validator.validate_python.assert_not_called()
+        assert len(bars) == 1
+
+    @pytest.mark.asyncio
+    async def test_malformed_qsd_frame_is_skipped(self) -> None:
+        """A qsd frame without a quote payload does not interrupt the stream."""
+        client = _make_client([{"m": "qsd", "p": ["qs_xxx"]}, make_du_update()])
+
+        with patch.multiple("tvkit.api.chart.ohlcv", **make_patches()):
+            bars: list[OHLCVBar] = await _collect(client.get_ohlcv(SYMBOL, "1", 1))
+
+        assert len(bars) == 1
+
+    @pytest.mark.asyncio
+    async def test_frames_without_bars_yield_nothing(self) -> None:
+        """Handled and unknown frame types that carry no bars are skipped."""
+        client = _make_client(
+            [
+                QUOTE_COMPLETED_MSG,
+                {"m": "series_loading", "p": ["cs_xxx"]},
+                {"m": "unknown_type", "p": []},
+                {"p": []},
+                make_du_update(),
+            ]
+        )
+
+        with patch.multiple("tvkit.api.chart.ohlcv", **make_patches()):
+            bars: list[OHLCVBar] = await _collect(client.get_ohlcv(SYMBOL, "1", 1))
+
+        assert [bar.timestamp for bar in bars] == [2_000_000.0]
+
+    @pytest.mark.asyncio
+    async def test_skipped_frames_are_not_formatted_without_debug(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Skipped frames are only rendered into log text when DEBUG is enabled."""
+
+        class CountingFrame(dict[str, Any]):
+            renders: int = 0
+
+            def __repr__(self) -> str:
+                CountingFrame.renders += 1
+                return super().__repr__()
+
+        client = _make_client([CountingFrame(m="unknown_type", p=[]), make_du_update()])
+
+        with (
+            caplog.at_level(logging.INFO, logger="tvkit.api.chart.ohlcv"),
+            patch.multiple("tvkit.api.chart.ohlcv", **make_patches()),
+        ):
+            bars: list[OHLCVBar] = await _collect(client.get_ohlcv(SYMBOL, "1", 1))
+
+        assert len(bars) == 1
+        assert CountingFrame.renders == 0
+
+
+class TestGetOhlcvErrors:
+    """Error handling in get_ohlcv() and get_quote_data()."""
+
+    SERIES_ERROR_MSG: dict[str, Any] = {
+        "m": "series_error",
+        "p": ["cs_xxx", "sds_1", "s1", "invalid resolution"],
+    }
+
+    @pytest.mark.asyncio
+    async def test_series_error_raises_value_error(self) -> None:
+        """series_error ends get_ohlcv() with ValueError and closes the connection."""
+        client = _make_client([self.SERIES_ERROR_MSG, make_du_update()])
+
+        with patch.multiple("tvkit.api.chart.ohlcv", **make_patches()):
+            with pytest.raises(ValueError, match="series error"):
+                await _collect(client.get_ohlcv(SYMBOL, "1", 1))
+
+        client.connection_service.close.assert_awaited()  # type: ignore[union-attr]
+
+    @pytest.mark.asyncio
+    async def test_quote_stream_series_error_raises_value_error(self) -> None:
+        """series_error ends get_quote_data() with ValueError."""
+        client = _make_client([self.SERIES_ERROR_MSG, QSD_MSG])
+
+        with patch.multiple("tvkit.api.chart.ohlcv", **make_patches()):
+            with pytest.raises(ValueError, match="series error"):
+                await _collect(client.get_quote_data(SYMBOL))
+
+    @pytest.mark.asyncio
+    async def test_malformed_bar_frames_are_skipped(self) -> None:
+        """Bar frames with unexpected shapes are skipped and the stream continues."""
+        bad_length: dict[str, Any] = make_du_update()
+        bad_length["p"][1]["sds_1"]["s"][0]["v"] = [2_000_000.0, 1.0, 2.0]
+        client = _make_client(
+            [
+                {"m": "du", "p": ["cs_xxx", "not-a-dict"]},
+                {"m": "timescale_update", "p": ["cs_xxx", "not-a-dict"]},
+                bad_length,
+                make_du_update(2_000_060.0),
+            ]
+        )
+
+        with patch.multiple("tvkit.api.chart.ohlcv", **make_patches()):
+            bars: list[OHLCVBar] = await _collect(client.get_ohlcv(SYMBOL, "1", 1))
+
+        assert [bar.timestamp for bar in bars] == [2_000_060.0]
+
+    @pytest.mark.asyncio
+    async def test_malformed_series_array_does_not_end_stream(self) -> None:
+        """A timescale_update whose series array is not a list is skipped by _stream."""
+        client = _make_client(
+            [
+                {"m": "timescale_update", "p": ["cs_xxx", {"sds_1": {"s": None}}]},
+                {"m": "timescale_update", "p": ["cs_xxx", {"sds_1": {"s": 5}}]},
+                make_timescale_update(2),
+                make_du_update(),
+            ]
+        )
+
+        with patch.multiple("tvkit.api.chart.ohlcv", **make_patches()):
+            batches: list[list[OHLCVBar]] = await _collect(client.get_ohlcv_batches(SYMBOL, "1", 2))
+
+        assert [[bar.timestamp for bar in batch] for batch in batches] == [
+            [1_000_000.0, 1_000_060.0],
+            [2_000_000.0],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_multi_stream_skips_malformed_bar_frames(self) -> None:
+        """A bar array of the wrong length skips the frame, not the multi-symbol stream."""
+        bad_length: dict[str, Any] = make_du_update()
+        bad_length["p"][1]["sds_1"]["s"][0]["v"] = [2_000_000.0, 1.0, 2.0]
+        client = _make_client([bad_length, make_du_update(2_000_060.0)])
+        patches: dict[str, Any] = make_patches()
+        patches["normalize_symbols"] = MagicMock(side_effect=lambda symbols: list(symbols))
+
+        with patch.multiple("tvkit.api.chart.ohlcv", **patches):
+            items: list[tuple[str, OHLCVBar]] = await _collect(
+                client.get_ohlcv_multi([SYMBOL], "1", 1)
+            )
+
+        assert [(symbol, bar.timestamp) for symbol, bar in items] == [(SYMBOL, 2_000_060.0)]
+
+    @pytest.mark.asyncio
+    async def test_multi_stream_series_error_raises_value_error(self) -> None:
+        """series_error still ends get_ohlcv_multi() with ValueError."""
+        client = _make_client([self.SERIES_ERROR_MSG, make_du_update()])
+        patches: dict[str, Any] = make_patches()
+        patches["normalize_symbols"] = MagicMock(side_effect=lambda symbols: list(symbols))
+
+        with patch.multiple("tvkit.api.chart.ohlcv", **patches):
+            with pytest.raises(ValueError, match="series error"):
+                await _collect(client.get_ohlcv_multi([SYMBOL], "1", 1))
+
+        client.connection_service.close.assert_awaited()  # type: ignore[union-attr]
+
+
+class TestGetOhlcvBatches:
+    """Per-frame batching in get_ohlcv_batches()."""
+
+    @pytest.mark.asyncio
+    async def test_yields_one_list_per_bar_frame(self) -> None:
+        """Each bar-carrying frame is yielded as one list; frames without bars are skipped."""
+        client = _make_client(
+            [make_timescale_update(3), QSD_MSG, QUOTE_COMPLETED_MSG, make_du_update()]
+        )
+
+        with patch.multiple("tvkit.api.chart.ohlcv", **make_patches()):
+            batches: list[list[OHLCVBar]] = await _collect(client.get_ohlcv_batches(SYMBOL, "1", 3))
+
+        assert [len(batch) for batch in batches] == [3, 1]
+        assert batches[1][0].timestamp == 2_000_000.0
+
+    @pytest.mark.asyncio
+    async def test_get_ohlcv_flattens_batches(self) -> None:
+        """get_ohlcv() yields exactly the bars of get_ohlcv_batches(), in order."""
+        messages: list[dict[str, Any]] = [make_timescale_update(3), make_du_update()]
+
+        with patch.multiple("tvkit.api.chart.ohlcv", **make_patches()):
+            batches: list[list[OHLCVBar]] = await _collect(
+                _make_client(messages).get_ohlcv_batches(SYMBOL, "1", 3)
+            )
+            bars: list[OHLCVBar] = await _collect(_make_client(messages).get_ohlcv(SYMBOL, "1", 3))
+
+        assert bars == [bar for batch in batches for bar in batch]
+
+
+class TestGetOhlcvMulti:
+    """Per-symbol fan-out in get_ohlcv_multi()."""
+
+    SYMBOLS: list[str] = ["BINANCE:BTCUSDT", "NASDAQ:AAPL"]
+
+    def _patches(self) -> dict[str, Any]:
+        patches: dict[str, Any] = make_patches()
+        patches["normalize_symbols"] = MagicMock(side_effect=lambda symbols: list(symbols))
+        return patches
+
+    @pytest.mark.asyncio
+    async def test_bars_are_tagged_with_their_series_symbol(self) -> None:
+        """Bars keyed sds_1 / sds_2 are yielded with the first / second symbol."""
+        du_two_series: dict[str, Any] = make_du_update()
+        du_two_series["p"][1]["sds_2"] = make_du_update(3_000_000.0)["p"][1]["sds_1"]
+        du_two_series["p"][1]["st1"] = {"st": [], "ns": {"d": "", "indexes": []}, "t": "st1"}
+        client = _make_client([make_timescale_update(2), QSD_MSG, du_two_series])
+
+        with patch.multiple("tvkit.api.chart.ohlcv", **self._patches()):
+            items: list[tuple[str, OHLCVBar]] = await _collect(
+                client.get_ohlcv_multi(self.SYMBOLS, "1", 2)
+            )
+
+        assert [(symbol, bar.timestamp) for symbol, bar in items] == [
+            ("BINANCE:BTCUSDT", 1_000_000.0),
+            ("BINANCE:BTCUSDT", 1_000_060.0),
+            ("BINANCE:BTCUSDT", 2_000_000.0),
+            ("NASDAQ:AAPL", 3_000_000.0),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_symbols_share_one_chart_session(self) -> None:
+        """The first symbol is the primary series; the rest are added as extra series."""
+        client = _make_client([])
+
+        with patch.multiple("tvkit.api.chart.ohlcv", **self._patches()):
+            await _collect(client.get_ohlcv_multi(self.SYMBOLS, "5", 20))
+
+        client._prepare_chart_session.assert_awaited_once_with(  # type: ignore[attr-defined]
+            "BINANCE:BTCUSDT", "5", 20, extra_symbols=("NASDAQ:AAPL",)
+        )
+
+    @pytest.mark.asyncio
+    async def test_empty_symbol_list_raises(self) -> None:
+        """At least one symbol is required."""
+        client = _make_client([])
+
+        with patch.multiple("tvkit.api.chart.ohlcv", **self._patches()):
+            with pytest.raises(ValueError, match="at least one symbol"):
+                await _collect(client.get_ohlcv_multi([], "1", 2))
+
+
+class TestGetQuoteDataDispatch:
+    """Message dispatch in get_quote_data()."""
+
+    @pytest.mark.asyncio
+    async def test_yields_quote_models_only_for_qsd(self) -> None:
+        """Only qsd frames are yielded, as QuoteSymbolData models."""
+        client = _make_client([QUOTE_COMPLETED_MSG, make_du_update(), QSD_MSG])
+
+        with patch.multiple("tvkit.api.chart.ohlcv", **make_patches()):
+            quotes: list[QuoteSymbolData] = await _collect(client.get_quote_data(SYMBOL))
+
+        assert len(quotes) == 1
+        assert isinstance(quotes[0], QuoteSymbolData)
+        assert quotes[0].current_price == 42000.5
+
+    @pytest.mark.asyncio
+    async def test_bar_frames_are_dropped_without_validation(self) -> None:
+        """Chart bar frames in the quote stream are skipped without building any model."""
+        client = _make_client([make_timescale_update(2), make_du_update(), QSD_MSG])
+
+        with (
+            patch.multiple("tvkit.api.chart.ohlcv", **make_patches()),
+            patch("tvkit.api.chart.ohlcv._OHLCV_VALIDATOR") as ohlcv_validator,
+            patch("tvkit.api.chart.ohlcv._TS_VALIDATOR") as ts_validator,
+        ):
+            quotes: list[QuoteSymbolData] = await _collect(client.get_quote_data(SYMBOL))
+
+        ohlcv_validator.validate_python.assert_not_called()
+        ts_validator.validate_python.assert_not_called()
+        assert len(quotes) == 1
+
+    @pytest.mark.asyncio
+    async def test_malformed_qsd_frame_is_skipped(self) -> None:
+        """A qsd frame that fails validation is skipped and the stream continues."""
+        client = _make_client([{"m": "qsd", "p": "not-a-list"}, QSD_MSG])
+
+        with patch.multiple("tvkit.api.chart.ohlcv", **make_patches()):
+            quotes: list[QuoteSymbolData] = await _collect(client.get_quote_data(SYMBOL))
+
+        assert len(quotes) == 1
+
+    @pytest.mark.asyncio
+    async def test_quote_completed_symbol_is_logged_from_raw_frame(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """quote_completed frames are logged from the raw params, even if they would not validate."""
+        client = _make_client(
+            [{"m": "quote_completed", "p": ["qs_xxx", SYMBOL], "extra": True}, QSD_MSG]
+        )
+
+        with (
+            caplog.at_level(logging.INFO, logger="tvkit.api.chart.ohlcv"),
+            patch.multiple("tvkit.api.chart.ohlcv", **make_patches()),
+        ):
+            quotes: list[QuoteSymbolData] = await _collect(client.get_quote_data(SYMBOL))
+
+        assert len(quotes) == 1
+        assert f"Quote setup completed for symbol: {SYMBOL}" in caplog.text
@@ -144,7 +144,8 @@ class TestMultiSymbolNormalization:
         client.connection_service = _mock_connection_service()
         client.message_service = MagicMock()
         client.message_service.generate_session = MagicMock(side_effect=["qs_1", "cs_1"])
-        client.message_service.get_send_message_callable = MagicMock(return_value=AsyncMock())
+        client.message_service.queue_message = AsyncMock()
+        client.message_service.flush = AsyncMock()
 
         call_order: list[str] = []
         captured_validate_arg: list[object] = []
@@ -0,0 +1,242 @@
+"""Tests for symbol validation in tvkit.api.utils.symbol_validator.
+
+All HTTP I/O is mocked — no network calls.
+"""
+
+import asyncio
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tvkit.api.utils import symbol_validator
+from tvkit.api.utils.symbol_validator import (
+    clear_symbol_cache,
+    shared_http_client,
+    validate_symbol_detailed,
+    validate_symbols,
+)
+
+_CLIENT_PATH = "tvkit.api.utils.symbol_validator.httpx.AsyncClient"
+
+
+def _mock_httpx_client(status_code: int) -> tuple[MagicMock, AsyncMock]:
+    """Return a patched ``httpx.AsyncClient`` context manager and its inner client."""
+    response = MagicMock()
+    response.status_code = status_code
+
+    client = AsyncMock()
+    client.get = AsyncMock(return_value=response)
+
+    ctx = MagicMock()
+    ctx.__aenter__ = AsyncMock(return_value=client)
+    ctx.__aexit__ = AsyncMock(return_value=False)
+    return ctx, client
+
+
+@pytest.fixture(autouse=True)
+def _clear_validated_symbols() -> Iterator[None]:
+    clear_symbol_cache()
+    yield
+    clear_symbol_cache()
+
+
+@pytest.mark.asyncio
+async def test_confirmed_symbol_is_not_requested_again() -> None:
+    ctx, client = _mock_httpx_client(200)
+    with patch(_CLIENT_PATH, return_value=ctx):
+        assert await validate_symbols("NASDAQ:AAPL") is True
+        assert await validate_symbols(["NASDAQ:AAPL"]) is True
+
+    assert client.get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_only_unconfirmed_symbols_are_requested() -> None:
+    ctx, client = _mock_httpx_client(200)
+    with patch(_CLIENT_PATH, return_value=ctx):
+        await validate_symbols("NASDAQ:AAPL")
+        await validate_symbols(["NASDAQ:AAPL", "BINANCE:BTCUSDT"])
+
+    urls: list[str] = [c.kwargs["url"] for c in client.get.await_args_list]
+    assert urls == [
+        "https://www.tradingview.com/symbols/NASDAQ:AAPL",
+        "https://www.tradingview.com/symbols/BINANCE:BTCUSDT",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rejected_symbol_is_not_remembered() -> None:
+    ctx, client = _mock_httpx_client(404)
+    with patch(_CLIENT_PATH, return_value=ctx):
+        with pytest.raises(ValueError, match="NASDAQ:NOPE"):
+            await validate_symbols("NASDAQ:NOPE")
+        with pytest.raises(ValueError, match="NASDAQ:NOPE"):
+            await validate_symbols("NASDAQ:NOPE")
+
+    assert client.get.await_count == 2
+    assert "NASDAQ:NOPE" not in symbol_validator._validated_symbols
+
+
+@pytest.mark.asyncio
+async def test_cache_is_bounded_and_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(symbol_validator, "_VALIDATED_SYMBOLS_MAXSIZE", 2)
+    ctx, client = _mock_httpx_client(200)
+    with patch(_CLIENT_PATH, return_value=ctx):
+        await validate_symbols(["NASDAQ:AAPL", "NASDAQ:MSFT"])
+        await validate_symbols("NASDAQ:AAPL")  # cache hit marks AAPL as recently used
+        await validate_symbols("NYSE:IBM")
+
+    assert list(symbol_validator._validated_symbols) == ["NASDAQ:AAPL", "NYSE:IBM"]
+    assert client.get.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_clear_symbol_cache_forces_revalidation() -> None:
+    ctx, client = _mock_httpx_client(200)
+    with patch(_CLIENT_PATH, return_value=ctx):
+        await validate_symbols("NASDAQ:AAPL")
+        clear_symbol_cache()
+        await validate_symbols("NASDAQ:AAPL")
+
+    assert client.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_empty_input_raises() -> None:
+    with pytest.raises(ValueError, match="cannot be empty"):
+        await validate_symbols([])
+
+
+@pytest.mark.asyncio
+async def test_symbols_are_checked_concurrently() -> None:
+    """Every symbol's request is in flight before any of them completes."""
+    symbols: list[str] = ["NASDAQ:AAPL", "NASDAQ:MSFT", "BINANCE:BTCUSDT"]
+    started: list[str] = []
+    all_started: asyncio.Event = asyncio.Event()
+
+    async def get(url: str) -> MagicMock:
+        started.append(url)
+        if len(started) == len(symbols):
+            all_started.set()
+        await asyncio.wait_for(all_started.wait(), timeout=1.0)
+        response = MagicMock()
+        response.status_code = 200
+        return response
+
+    ctx, client = _mock_httpx_client(200)
+    client.get = AsyncMock(side_effect=get)
+    with patch(_CLIENT_PATH, return_value=ctx):
+        assert await validate_symbols(symbols) is True
+
+    assert len(started) == 3
+    assert set(symbol_validator._validated_symbols) == set(symbols)
+
+
+@pytest.mark.asyncio
+async def test_first_failing_symbol_in_input_order_is_reported() -> None:
+    """With several invalid symbols, the error names the first one in the input list."""
+
+    async def get(url: str) -> MagicMock:
+        response = MagicMock()
+        response.status_code = 200 if url.endswith("NASDAQ:AAPL") else 404
+        return response
+
+    ctx, client = _mock_httpx_client(200)
+    client.get = AsyncMock(side_effect=get)
+    with patch(_CLIENT_PATH, return_value=ctx):
+        with pytest.raises(ValueError, match="NASDAQ:BAD1"):
+            await validate_symbols(["NASDAQ:AAPL", "NASDAQ:BAD1", "NASDAQ:BAD2"])
+
+    assert list(symbol_validator._validated_symbols) == ["NASDAQ:AAPL"]
+
+
+@pytest.mark.asyncio
+async def test_rejected_symbol_cancels_checks_of_later_symbols() -> None:
+    """A 404 cancels the symbols after it instead of waiting for their retries."""
+    cancelled: list[str] = []
+
+    async def get(url: str) -> MagicMock:
+        response = MagicMock()
+        if url.endswith("NASDAQ:BAD"):
+            response.status_code = 404
+            return response
+        try:
+            await asyncio.Event().wait()  # a lookup that would keep retrying
+        except asyncio.CancelledError:
+            cancelled.append(url)
+            raise
+        return response
+
+    ctx, client = _mock_httpx_client(200)
+    client.get = AsyncMock(side_effect=get)
+    with patch(_CLIENT_PATH, return_value=ctx):
+        with pytest.raises(ValueError, match="NASDAQ:BAD"):
+            await asyncio.wait_for(validate_symbols(["NASDAQ:BAD", "NASDAQ:SLOW"]), timeout=1.0)
+
+    assert cancelled == ["https://www.tradingview.com/symbols/NASDAQ:SLOW"]
+    assert not symbol_validator._validated_symbols
+
+
+@pytest.mark.asyncio
+async def test_earlier_symbols_finish_before_a_failure_is_reported() -> None:
+    """Symbols before the failing one still complete, so an earlier failure wins."""
+    release: asyncio.Event = asyncio.Event()
+
+    async def get(url: str) -> MagicMock:
+        response = MagicMock()
+        if url.endswith("NASDAQ:BAD2"):
+            response.status_code = 404
+            release.set()  # the later failure is seen first
+            return response
+        await release.wait()
+        await asyncio.sleep(0.01)  # still in flight when the later failure completes
+        response.status_code = 404 if url.endswith("NASDAQ:BAD1") else 200
+        return response
+
+    ctx, client = _mock_httpx_client(200)
+    client.get = AsyncMock(side_effect=get)
+    with patch(_CLIENT_PATH, return_value=ctx):
+        with pytest.raises(ValueError, match="NASDAQ:BAD1"):
+            await asyncio.wait_for(
+                validate_symbols(["NASDAQ:AAPL", "NASDAQ:BAD1", "NASDAQ:BAD2"]), timeout=1.0
+            )
+
+    assert list(symbol_validator._validated_symbols) == ["NASDAQ:AAPL"]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_symbols_are_requested_once() -> None:
+    ctx, client = _mock_httpx_client(200)
+    with patch(_CLIENT_PATH, return_value=ctx):
+        await validate_symbols(["NASDAQ:AAPL", "NASDAQ:AAPL"])
+
+    assert client.get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_http_client_is_reused_across_calls() -> None:
+    """Inside shared_http_client(), validations reuse its client instead of opening new ones."""
+    ctx, client = _mock_httpx_client(200)
+    with patch(_CLIENT_PATH, return_value=ctx) as client_cls:
+        async with shared_http_client() as shared:
+            await validate_symbols("NASDAQ:AAPL")
+            outcome = await validate_symbol_detailed("NASDAQ:MSFT")
+
+    assert shared is client
+    assert outcome.is_valid is True
+    assert client_cls.call_count == 1
+    assert client.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_http_client_is_uninstalled_on_exit() -> None:
+    ctx, _ = _mock_httpx_client(200)
+    with patch(_CLIENT_PATH, return_value=ctx) as client_cls:
+        async with shared_http_client():
+            pass
+        await validate_symbols("NASDAQ:AAPL")
+
+    assert client_cls.call_count == 2
@@ -208,8 +208,10 @@ class OHLCVResponse(BaseModel):
         if len(self.parameters) < 2:
             return {}
 
-        data: dict[str, Any] = self.parameters[1]
+        data: Any = self.parameters[1]
         series_updates: dict[str, SeriesUpdate] = {}
+        if not isinstance(data, dict):
+            return series_updates
 
         for series_name, series_data in data.items():
             try:
@@ -237,6 +239,18 @@ class OHLCVResponse(BaseModel):
 
         return bars
 
+    def ohlcv_bars_by_series(self) -> dict[str, list[OHLCVBar]]:
+        """
+        Group the OHLCV bars in the response by series identifier.
+
+        Returns:
+            dict[str, list[OHLCVBar]]: Bars keyed by series identifier (e.g. ``"sds_1"``)
+        """
+        return {
+            series_name: [series_data.ohlcv_bar for series_data in series_update.series_data]
+            for series_name, series_update in self.series_updates.items()
+        }
+
 
 class TimescaleUpdateResponse(BaseModel):
     """
@@ -277,17 +291,30 @@ class TimescaleUpdateResponse(BaseModel):
         Returns:
             List[OHLCVBar]: List of all OHLCV bars in the update
         """
-        bars: list[OHLCVBar] = []
+        return [bar for bars in self.ohlcv_bars_by_series().values() for bar in bars]
+
+    def ohlcv_bars_by_series(self) -> dict[str, list[OHLCVBar]]:
+        """
+        Group the OHLCV bars in the timescale update by series identifier.
+
+        Returns:
+            dict[str, list[OHLCVBar]]: Bars keyed by series identifier (e.g. ``"sds_1"``)
+        """
+        bars_by_series: dict[str, list[OHLCVBar]] = {}
 
         if len(self.parameters) < 2:
-            return bars
+            return bars_by_series
 
         # The second parameter contains the series data
-        series_data_dict: dict[str, Any] = self.parameters[1]
+        series_data_dict: Any = self.parameters[1]
+        if not isinstance(series_data_dict, dict):
+            return bars_by_series
 
         # Look for series data (usually named like "sds_1")
-        for series_info in series_data_dict.values():
-            if isinstance(series_info, dict) and "s" in series_info:
+        for series_name, series_info in series_data_dict.items():
+            # Skip entries without a series array (e.g. study data or a malformed "s")
+            if isinstance(series_info, dict) and isinstance(series_info.get("s"), list):
+                bars: list[OHLCVBar] = bars_by_series.setdefault(series_name, [])
                 # Extract the series array
                 series_array: list[Any] = series_info["s"]
 
@@ -303,7 +330,7 @@ class TimescaleUpdateResponse(BaseModel):
                             except Exception:
                                 continue  # Skip malformed bars
 
-        return bars
+        return bars_by_series
 
 
 class QuoteSymbolData(BaseModel):
@@ -5,10 +5,11 @@ import logging
 import math
 import os
 import types
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Mapping
+from contextlib import aclosing
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Protocol, TypeVar
 
 from pydantic import ValidationError
 
@@ -17,7 +18,6 @@ from tvkit.api.chart.models.adjustment import Adjustment
 from tvkit.api.chart.models.ohlcv import (
     OHLCVBar,
     OHLCVResponse,
-    QuoteCompletedMessage,
     QuoteSymbolData,
     TimescaleUpdateResponse,
 )
@@ -39,6 +39,22 @@ from tvkit.time import ensure_utc
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+class _FrameValidator(Protocol):
+    """The part of a Pydantic core validator used on the streaming hot path."""
+
+    def validate_python(self, input: Any, /) -> Any: ...
+
+
+# Core validators of the streamed frame models, resolved once at import. Calling
+# ``validate_python`` on them directly skips the ``Model.model_validate`` wrapper
+# (and the extra layer a ``TypeAdapter`` adds), which adds up in per-frame loops.
+_OHLCV_VALIDATOR: _FrameValidator = OHLCVResponse.__pydantic_validator__
+_TS_VALIDATOR: _FrameValidator = TimescaleUpdateResponse.__pydantic_validator__
+_QSD_VALIDATOR: _FrameValidator = QuoteSymbolData.__pydantic_validator__
+
 
 def _normalize_input(dt: datetime | str) -> datetime:
     """Normalize a start/end input to a UTC-aware datetime (integer-second precision).
@@ -60,6 +76,133 @@ def _normalize_input(dt: datetime | str) -> datetime:
     return _to_utc_datetime(dt)
 
 
+def _quote_values(data: dict[str, Any]) -> dict[str, Any]:
+    """Return the quote field map of a raw ``qsd`` frame without model validation.
+
+    A ``qsd`` frame has the shape ``{"m": "qsd", "p": [session, {"n": ..., "v": {...}}]}``.
+
+    Args:
+        data: Parsed ``qsd`` WebSocket frame.
+
+    Returns:
+        The ``v`` mapping (e.g. ``lp`` for last price), or an empty dict when absent.
+    """
+    params: Any = data.get("p")
+    if isinstance(params, list) and len(params) > 1 and isinstance(params[1], dict):
+        values: Any = params[1].get("v")
+        if isinstance(values, dict):
+            return values
+    return {}
+
+
+def _handle_du(data: dict[str, Any]) -> list[OHLCVBar]:
+    """Return the bars of a ``du`` (data update) frame, or none if it does not parse."""
+    try:
+        return _OHLCV_VALIDATOR.validate_python(data).ohlcv_bars
+    except ValueError as e:
+        # ValidationError, or a bar array of the wrong length in OHLCVBar.from_array.
+        logger.debug("Failed to parse 'du' message as OHLCV: %s", e)
+        return []
+
+
+def _handle_timescale_update(data: dict[str, Any]) -> list[OHLCVBar]:
+    """Return the bars of a ``timescale_update`` frame, or none if it does not parse."""
+    try:
+        bars: list[OHLCVBar] = _TS_VALIDATOR.validate_python(data).ohlcv_bars
+    except ValueError as e:
+        # ValidationError, or a bar array that does not parse; same as _handle_du.
+        logger.debug("Failed to parse 'timescale_update' message as OHLCV: %s", e)
+        return []
+    logger.info("Received %d OHLCV bars from timescale update", len(bars))
+    return bars
+
+
+def _handle_qsd(data: dict[str, Any]) -> list[OHLCVBar]:
+    """Log the last price from a ``qsd`` frame; it carries no bars."""
+    # Only logged, so read the raw frame instead of validating a QuoteSymbolData
+    # model that would be discarded immediately.
+    quote_values: dict[str, Any] = _quote_values(data)
+    current_price: Any = quote_values.get("lp")
+    if current_price is not None:
+        logger.info("Quote data for %s: Current price = $%s", data["p"][1].get("n"), current_price)
+    logger.debug("Quote symbol data: %s", quote_values)
+    return []
+
+
+def _quote_completed_symbol(data: dict[str, Any]) -> str:
+    """Return the symbol of a raw ``quote_completed`` frame without model validation.
+
+    A ``quote_completed`` frame has the shape ``{"m": "quote_completed", "p": [session, symbol]}``.
+
+    Args:
+        data: Parsed ``quote_completed`` WebSocket frame.
+
+    Returns:
+        The symbol, or an empty string when absent.
+    """
+    params: Any = data.get("p")
+    if isinstance(params, list) and len(params) > 1:
+        return str(params[1])
+    return ""
+
+
+def _log_quote_completed(data: dict[str, Any]) -> None:
+    """Log the symbol of a ``quote_completed`` frame."""
+    # Only logged, so no QuoteCompletedMessage is validated for it.
+    logger.info("Quote setup completed for symbol: %s", _quote_completed_symbol(data))
+
+
+def _handle_quote_completed(data: dict[str, Any]) -> list[OHLCVBar]:
+    """Log a ``quote_completed`` frame; it carries no bars."""
+    _log_quote_completed(data)
+    return []
+
+
+_StreamHandler = Callable[[dict[str, Any]], list[OHLCVBar]]
+
+# Per-message-type handlers for the get_ohlcv() stream, looked up once per frame.
+# Types not listed here (loading/completed notices, series_error) are rare and
+# handled inline.
+_STREAM_HANDLERS: dict[str, _StreamHandler] = {
+    "du": _handle_du,
+    "timescale_update": _handle_timescale_update,
+    "qsd": _handle_qsd,
+    "quote_completed": _handle_quote_completed,
+}
+
+
+def _parse_quote(data: dict[str, Any]) -> QuoteSymbolData | None:
+    """Return the ``QuoteSymbolData`` of a ``qsd`` frame, or None if it does not parse."""
+    try:
+        return _QSD_VALIDATOR.validate_python(data)
+    except ValidationError as e:
+        logger.debug("Failed to parse 'qsd' message: %s", e)
+        return None
+
+
+def _skip_quote_frame(data: dict[str, Any]) -> None:
+    """Ignore a frame without quote data (chart bars) in the quote stream."""
+    return None
+
+
+def _handle_quote_stream_completed(data: dict[str, Any]) -> None:
+    """Log a ``quote_completed`` frame; it carries no quote data."""
+    _log_quote_completed(data)
+
+
+_QuoteStreamHandler = Callable[[dict[str, Any]], QuoteSymbolData | None]
+
+# Per-message-type handlers for the get_quote_data() stream. The chart session
+# keeps sending bar updates, so du/timescale_update frames are listed too and
+# dropped after a single lookup.
+_QUOTE_STREAM_HANDLERS: dict[str, _QuoteStreamHandler] = {
+    "qsd": _parse_quote,
+    "quote_completed": _handle_quote_stream_completed,
+    "du": _skip_quote_frame,
+    "timescale_update": _skip_quote_frame,
+}
+
+
 # Intervals that bypass segmentation. Monthly/weekly intervals never accumulate enough
 # bars to require segmentation, and variable-length durations make segment sizing
 # unreliable. Keep in sync with _UNSUPPORTED_INTERVALS in utils.py.
@@ -101,6 +244,8 @@ class _StreamingSession:
         adjustment: Price adjustment mode. Stored so that ``_restore_session``
             replays the correct adjustment type after a WebSocket reconnect.
             Defaults to ``Adjustment.SPLITS`` (identical to pre-v0.11.0 behaviour).
+        extra_symbols: Further symbols streamed on the same chart session by
+            ``get_ohlcv_multi()``, subscribed as series 2, 3, ... after ``symbol``.
     """
 
     symbol: str
@@ -110,6 +255,7 @@ class _StreamingSession:
     chart_session: str
     range_param: str = ""
     adjustment: Adjustment = Adjustment.SPLITS
+    extra_symbols: tuple[str, ...] = ()
 
 
 # Timeout constants for get_historical_ohlcv().
@@ -415,11 +561,12 @@ class OHLCV:
             if self.connection_service.ws is None:
                 raise RuntimeError("WebSocket connection not established after reconnect")
             self.message_service = MessageService(self.connection_service.ws)
-            send_message_func = self.message_service.get_send_message_callable()
+            # Queue the whole setup burst and deliver it in a single WebSocket send.
+            queue_message = self.message_service.queue_message
             await self.connection_service.initialize_sessions(
                 session.quote_session,
                 session.chart_session,
-                send_message_func,
+                queue_message,
             )
             await self.connection_service.add_symbol_to_sessions(
                 session.quote_session,
@@ -427,10 +574,22 @@ class OHLCV:
                 session.symbol,
                 session.interval,
                 session.bars_count,
-                send_message_func,
+                queue_message,
                 range_param=session.range_param,
                 adjustment=session.adjustment,
             )
+            for series_index, extra_symbol in enumerate(session.extra_symbols, start=2):
+                await self.connection_service.add_series_to_sessions(
+                    session.quote_session,
+                    session.chart_session,
+                    extra_symbol,
+                    session.interval,
+                    session.bars_count,
+                    series_index,
+                    queue_message,
+                    adjustment=session.adjustment,
+                )
+            await self.message_service.flush()
         except Exception:
             logger.exception(
                 "Failed to restore streaming session after reconnect.",
@@ -450,6 +609,7 @@ class OHLCV:
         *,
         range_param: str = "",
         adjustment: Adjustment = Adjustment.SPLITS,
+        extra_symbols: tuple[str, ...] = (),
     ) -> None:
         """
         Set up services and subscribe the chart session to symbol data.
@@ -467,6 +627,8 @@ class OHLCV:
             adjustment: Price adjustment mode forwarded to ``add_symbol_to_sessions()``.
                 Defaults to ``Adjustment.SPLITS``. Stored in ``_StreamingSession`` so
                 that ``_restore_session`` replays the correct type after reconnect.
+            extra_symbols: Further symbols (EXCHANGE:SYMBOL) to add to the same chart
+                session as series 2, 3, ... Count mode only. Defaults to none.
 
         Raises:
             RuntimeError: If services fail to initialize.
@@ -477,11 +639,12 @@ class OHLCV:
 
         quote_session: str = self.message_service.generate_session(prefix="qs_")
         chart_session: str = self.message_service.generate_session(prefix="cs_")
-        logger.debug(f"Sessions: quote={quote_session}, chart={chart_session}")
+        logger.debug("Sessions: quote=%s, chart=%s", quote_session, chart_session)
 
-        send_message_func = self.message_service.get_send_message_callable()
+        # Queue the whole setup burst and deliver it in a single WebSocket send.
+        queue_message = self.message_service.queue_message
         await self.connection_service.initialize_sessions(
-            quote_session, chart_session, send_message_func
+            quote_session, chart_session, queue_message
         )
         await self.connection_service.add_symbol_to_sessions(
             quote_session,
@@ -489,10 +652,22 @@ class OHLCV:
             converted_symbol,
             interval,
             bars_count,
-            send_message_func,
+            queue_message,
             range_param=range_param,
             adjustment=adjustment,
         )
+        for series_index, extra_symbol in enumerate(extra_symbols, start=2):
+            await self.connection_service.add_series_to_sessions(
+                quote_session,
+                chart_session,
+                extra_symbol,
+                interval,
+                bars_count,
+                series_index,
+                queue_message,
+                adjustment=adjustment,
+            )
+        await self.message_service.flush()
         self._session = _StreamingSession(
             symbol=converted_symbol,
             interval=interval,
@@ -501,8 +676,118 @@ class OHLCV:
             chart_session=chart_session,
             range_param=range_param,
             adjustment=adjustment,
+            extra_symbols=extra_symbols,
         )
 
+    async def _open_stream(
+        self, exchange_symbol: str, interval: str, bars_count: int
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Validate the request, subscribe a chart session and return its frame stream.
+
+        Shared setup of the single-symbol real-time generators (``get_ohlcv_batches``,
+        ``get_quote_data`` and ``get_ohlcv_raw``).
+
+        Args:
+            exchange_symbol: The symbol in 'EXCHANGE:SYMBOL' or 'EXCHANGE-SYMBOL' format.
+            interval: The interval for the chart.
+            bars_count: The number of bars to fetch.
+
+        Returns:
+            The connection's parsed frame stream (``ConnectionService.get_data_stream()``).
+
+        Raises:
+            ValueError: If the symbol or interval is invalid.
+            RuntimeError: If services fail to initialize.
+        """
+        canonical: str = normalize_symbol(exchange_symbol)
+        await validate_symbols(canonical)
+        validate_interval(interval)
+        await self._prepare_chart_session(canonical, interval, bars_count)
+
+        if self.connection_service is None:
+            raise RuntimeError("Services not properly initialized")
+
+        return self.connection_service.get_data_stream()
+
+    async def _stream(
+        self,
+        exchange_symbol: str,
+        interval: str,
+        bars_count: int,
+        handlers: Mapping[str, Callable[[dict[str, Any]], _T | None]],
+        stream_name: str,
+    ) -> AsyncGenerator[_T, None]:
+        """
+        Open a chart-session stream and yield what the per-type handlers extract.
+
+        The single dispatch loop behind ``get_ohlcv_batches()`` and
+        ``get_quote_data()``; they differ only in their handler table. A handler
+        returns the item to yield, or a falsy value (``None``, ``[]``) to yield
+        nothing for that frame. Frame types without a handler are loading/completed
+        notices (logged), ``series_error`` (raised) or skipped.
+
+        Args:
+            exchange_symbol: The symbol in 'EXCHANGE:SYMBOL' or 'EXCHANGE-SYMBOL' format.
+            interval: The interval for the chart.
+            bars_count: The number of bars to fetch.
+            handlers: Message type to handler, e.g. ``_STREAM_HANDLERS``.
+            stream_name: Stream description used in log messages.
+
+        Returns:
+            An async generator yielding the handlers' non-empty results in arrival order.
+
+        Raises:
+            ValueError: If the symbol or interval is invalid, or TradingView reports a
+                series error.
+            RuntimeError: If services fail to initialize.
+        """
+        stream: AsyncGenerator[dict[str, Any], None] = await self._open_stream(
+            exchange_symbol, interval, bars_count
+        )
+
+        async for data in stream:
+            if not isinstance(data, dict):
+                continue
+            message_type: str | None = data.get("m")
+
+            logger.debug("Received message type: %s", message_type)
+
+            handler: Callable[[dict[str, Any]], _T | None] | None = handlers.get(message_type or "")
+            if handler is not None:
+                item: _T | None = handler(data)
+                if item:
+                    yield item
+                continue
+
+            if message_type in (
+                "series_loading",
+                "study_loading",
+                "series_completed",
+                "study_completed",
+            ):
+                logger.debug("%s for %s", message_type, stream_name)
+                continue
+
+            elif message_type == "series_error":
+                logger.error("Series error received from TradingView during %s", stream_name)
+                logger.error("Error details: %s", data)
+                logger.error(
+                    "Please check the interval - this timeframe may not be supported for the symbol"
+                )
+                logger.error("Also verify that bars_count is within valid range")
+                if self.connection_service:
+                    await self.connection_service.close()
+                raise ValueError(
+                    "TradingView series error: Invalid interval or bars count. "
+                    "Please check that the timeframe is supported for this symbol "
+                    "and that bars_count is within valid range."
+                )
+
+            else:
+                logger.debug("Skipping message type '%s' in %s", message_type, stream_name)
+                continue
+
     def _validate_range(self, start: datetime, end: datetime) -> tuple[datetime, datetime]:
         """
         Validate a date range and clamp future end dates.
@@ -671,40 +956,36 @@ class OHLCV:
                 if message_type == "timescale_update":
                     try:
                         logger.debug("Raw timescale_update data: %s", data)
-                        timescale_response: TimescaleUpdateResponse = (
-                            TimescaleUpdateResponse.model_validate(data)
+                        timescale_response: TimescaleUpdateResponse = _TS_VALIDATOR.validate_python(
+                            data
                         )
                         bars: list[OHLCVBar] = timescale_response.ohlcv_bars
                         logger.info("Received %d historical OHLCV bars", len(bars))
                         historical_bars.extend(bars)
                     except ValidationError as e:
-                        logger.warning(f"Failed to parse 'timescale_update' message: {e}")
-                        logger.debug(f"Raw message that failed to parse: {data}")
+                        logger.warning("Failed to parse 'timescale_update' message: %s", e)
+                        logger.debug("Raw message that failed to parse: %s", data)
                         continue
 
                 elif message_type == "du":
                     try:
-                        ohlcv_response: OHLCVResponse = OHLCVResponse.model_validate(data)
+                        ohlcv_response: OHLCVResponse = _OHLCV_VALIDATOR.validate_python(data)
                         du_bars: list[OHLCVBar] = ohlcv_response.ohlcv_bars
                         if du_bars:
                             logger.info("Received %d OHLCV bars from data update", len(du_bars))
                             historical_bars.extend(du_bars)
                     except ValidationError as e:
-                        logger.debug(f"Failed to parse 'du' message as OHLCV: {e}")
+                        logger.debug("Failed to parse 'du' message as OHLCV: %s", e)
                         continue
 
                 elif message_type == "quote_completed":
-                    try:
-                        quote_completed: QuoteCompletedMessage = (
-                            QuoteCompletedMessage.model_validate(data)
-                        )
-                        logger.debug(f"Quote setup completed for symbol: {quote_completed.symbol}")
-                    except ValidationError as e:
-                        logger.debug(f"Failed to parse 'quote_completed' message: {e}")
+                    logger.debug(
+                        "Quote setup completed for symbol: %s", _quote_completed_symbol(data)
+                    )
                     continue
 
                 elif message_type in ("series_loading", "study_loading"):
-                    logger.debug(f"{message_type} for historical data fetch")
+                    logger.debug("%s for historical data fetch", message_type)
                     continue
 
                 elif message_type == "series_completed":
@@ -754,7 +1035,7 @@ class OHLCV:
                     logger.error(
                         "Series error received from TradingView during historical data fetch"
                     )
-                    logger.error(f"Error details: {data}")
+                    logger.error("Error details: %s", data)
                     logger.error(
                         "Please check the interval - this timeframe may not be supported for the symbol"
                     )
@@ -768,7 +1049,9 @@ class OHLCV:
                     )
 
                 else:
-                    logger.debug(f"Skipping message type '{message_type}' in historical data fetch")
+                    logger.debug(
+                        "Skipping message type '%s' in historical data fetch", message_type
+                    )
                     continue
 
             except Exception as e:
@@ -780,7 +1063,7 @@ class OHLCV:
                 if isinstance(e, ValueError) and not isinstance(e, ValidationError):
                     raise
                 logger.debug(
-                    f"Skipping unparseable message in historical fetch: {data} - Error: {e}"
+                    "Skipping unparseable message in historical fetch: %s - Error: %s", data, e
                 )
                 continue
 
@@ -836,7 +1119,7 @@ class OHLCV:
             )
 
         if not historical_bars:
-            logger.warning(f"No historical bars received for symbol {canonical}")
+            logger.warning("No historical bars received for symbol %s", canonical)
             raise NoHistoricalDataError(f"No historical data received for symbol {canonical}")
 
         logger.info(
@@ -916,8 +1199,8 @@ class OHLCV:
                 if message_type == "timescale_update":
                     try:
                         logger.debug("Raw timescale_update data: %s", data)
-                        timescale_response: TimescaleUpdateResponse = (
-                            TimescaleUpdateResponse.model_validate(data)
+                        timescale_response: TimescaleUpdateResponse = _TS_VALIDATOR.validate_python(
+                            data
                         )
                         bars: list[OHLCVBar] = timescale_response.ohlcv_bars
                         logger.info("Received %d historical OHLCV bars", len(bars))
@@ -930,33 +1213,29 @@ class OHLCV:
                             bars_count_satisfied = True
                             break
                     except ValidationError as e:
-                        logger.warning(f"Failed to parse 'timescale_update' message: {e}")
-                        logger.debug(f"Raw message that failed to parse: {data}")
+                        logger.warning("Failed to parse 'timescale_update' message: %s", e)
+                        logger.debug("Raw message that failed to parse: %s", data)
                         continue
 
                 elif message_type == "du":
                     try:
-                        ohlcv_response: OHLCVResponse = OHLCVResponse.model_validate(data)
+                        ohlcv_response: OHLCVResponse = _OHLCV_VALIDATOR.validate_python(data)
                         du_bars: list[OHLCVBar] = ohlcv_response.ohlcv_bars
                         if du_bars:
                             logger.info("Received %d OHLCV bars from data update", len(du_bars))
                             historical_bars.extend(du_bars)
                     except ValidationError as e:
-                        logger.debug(f"Failed to parse 'du' message as OHLCV: {e}")
+                        logger.debug("Failed to parse 'du' message as OHLCV: %s", e)
                         continue
 
                 elif message_type == "quote_completed":
-                    try:
-                        quote_completed: QuoteCompletedMessage = (
-                            QuoteCompletedMessage.model_validate(data)
-                        )
-                        logger.debug(f"Quote setup completed for symbol: {quote_completed.symbol}")
-                    except ValidationError as e:
-                        logger.debug(f"Failed to parse 'quote_completed' message: {e}")
+                    logger.debug(
+                        "Quote setup completed for symbol: %s", _quote_completed_symbol(data)
+                    )
                     continue
 
                 elif message_type in ("series_loading", "study_loading"):
-                    logger.debug(f"{message_type} for historical data fetch")
+                    logger.debug("%s for historical data fetch", message_type)
                     continue
 
                 elif message_type == "series_completed":
@@ -1011,7 +1290,7 @@ class OHLCV:
                     logger.error(
                         "Series error received from TradingView during historical data fetch"
                     )
-                    logger.error(f"Error details: {data}")
+                    logger.error("Error details: %s", data)
                     logger.error(
                         "Please check the interval - this timeframe may not be supported for the symbol"
                     )
@@ -1025,7 +1304,9 @@ class OHLCV:
                     )
 
                 else:
-                    logger.debug(f"Skipping message type '{message_type}' in historical data fetch")
+                    logger.debug(
+                        "Skipping message type '%s' in historical data fetch", message_type
+                    )
                     continue
 
             except Exception as e:
@@ -1035,7 +1316,7 @@ class OHLCV:
                 if isinstance(e, ValueError) and not isinstance(e, ValidationError):
                     raise
                 logger.debug(
-                    f"Skipping unparseable message in historical fetch: {data} - Error: {e}"
+                    "Skipping unparseable message in historical fetch: %s - Error: %s", data, e
                 )
                 continue
 
@@ -1052,7 +1333,7 @@ class OHLCV:
         historical_bars.sort(key=lambda bar: bar.timestamp)
 
         if not historical_bars:
-            logger.warning(f"No historical bars received for symbol {canonical}")
+            logger.warning("No historical bars received for symbol %s", canonical)
             raise RuntimeError(f"No historical data received for symbol {canonical}")
 
         if len(historical_bars) < bars_count:
@@ -1079,6 +1360,7 @@ class OHLCV:
         This is the primary method for streaming structured OHLCV data from TradingView.
         Each yielded bar contains open, high, low, close, volume, and timestamp information.
         Symbols are automatically converted from EXCHANGE-SYMBOL to EXCHANGE:SYMBOL format.
+        Use ``get_ohlcv_batches()`` to receive the bars of each frame as one list.
 
         Args:
             exchange_symbol: The symbol in 'EXCHANGE:SYMBOL' or 'EXCHANGE-SYMBOL' format (e.g., 'BINANCE:BTCUSDT' or 'USI-PCC').
@@ -1097,99 +1379,134 @@ class OHLCV:
             ...     async for bar in client.get_ohlcv("BINANCE:BTCUSDT", interval="5"):
             ...         print(f"Close: ${bar.close}, Volume: {bar.volume}")
         """
-        canonical: str = normalize_symbol(exchange_symbol)
-        await validate_symbols(canonical)
-        validate_interval(interval)
-        await self._prepare_chart_session(canonical, interval, bars_count)
+        async with aclosing(
+            self.get_ohlcv_batches(exchange_symbol, interval, bars_count)
+        ) as batches:
+            async for batch in batches:
+                for ohlcv_bar in batch:
+                    yield ohlcv_bar
+
+    def get_ohlcv_batches(
+        self, exchange_symbol: str, interval: str = "1", bars_count: int = 10
+    ) -> AsyncGenerator[list[OHLCVBar], None]:
+        """
+        Returns an async generator that yields OHLCV bars one WebSocket frame at a time.
 
-        if self.connection_service is None:
-            raise RuntimeError("Services not properly initialized")
+        Same stream as ``get_ohlcv()``, but each ``timescale_update`` or ``du`` frame
+        is yielded as a single list instead of bar by bar. The initial history
+        (``bars_count`` bars) therefore arrives as one list, which saves a generator
+        round trip per bar and lets consumers process each frame as a block.
 
-        async for data in self.connection_service.get_data_stream():
-            try:
-                if not isinstance(data, dict):
-                    continue
-                message_type: str | None = data.get("m")
+        Args:
+            exchange_symbol: The symbol in 'EXCHANGE:SYMBOL' or 'EXCHANGE-SYMBOL' format (e.g., 'BINANCE:BTCUSDT' or 'USI-PCC').
+            interval: The interval for the chart (default is "1" for 1 minute).
+            bars_count: The number of bars to fetch (default is 10).
 
-                logger.debug("Received message type: %s", message_type)
+        Returns:
+            An async generator yielding non-empty lists of OHLCVBar objects, in arrival order.
 
-                if message_type == "du":
-                    try:
-                        ohlcv_response: OHLCVResponse = OHLCVResponse.model_validate(data)
-                        for ohlcv_bar in ohlcv_response.ohlcv_bars:
-                            yield ohlcv_bar
-                    except ValidationError as e:
-                        logger.debug(f"Failed to parse 'du' message as OHLCV: {e}")
-                        continue
+        Raises:
+            ValueError: If the symbol format is invalid
+            WebSocketException: If connection or streaming fails
 
-                elif message_type == "timescale_update":
-                    try:
-                        timescale_response: TimescaleUpdateResponse = (
-                            TimescaleUpdateResponse.model_validate(data)
-                        )
-                        bars: list[OHLCVBar] = timescale_response.ohlcv_bars
-                        logger.info("Received %d OHLCV bars from timescale update", len(bars))
-                        for ohlcv_bar in bars:
-                            yield ohlcv_bar
-                    except ValidationError as e:
-                        logger.debug(f"Failed to parse 'timescale_update' message as OHLCV: {e}")
-                        continue
+        Example:
+            >>> async with OHLCV() as client:
+            ...     async for bars in client.get_ohlcv_batches("BINANCE:BTCUSDT", interval="5"):
+            ...         print(f"{len(bars)} bars, last close: ${bars[-1].close}")
+        """
+        return self._stream(
+            exchange_symbol, interval, bars_count, _STREAM_HANDLERS, "real-time data stream"
+        )
 
-                elif message_type == "qsd":
-                    try:
-                        quote_data: QuoteSymbolData = QuoteSymbolData.model_validate(data)
-                        current_price: float | None = quote_data.current_price
-                        if current_price is not None:
-                            logger.info(
-                                f"Quote data for {exchange_symbol}: Current price = ${current_price}"
-                            )
-                        logger.debug(f"Quote symbol data: {quote_data.symbol_info}")
-                    except ValidationError as e:
-                        logger.debug(f"Failed to parse 'qsd' message: {e}")
-                    continue
+    async def get_ohlcv_multi(
+        self, exchange_symbols: list[str], interval: str = "1", bars_count: int = 10
+    ) -> AsyncGenerator[tuple[str, OHLCVBar], None]:
+        """
+        Returns an async generator that streams OHLCV bars for several symbols over one connection.
 
-                elif message_type == "quote_completed":
-                    try:
-                        quote_completed: QuoteCompletedMessage = (
-                            QuoteCompletedMessage.model_validate(data)
-                        )
-                        logger.info(f"Quote setup completed for symbol: {quote_completed.symbol}")
-                    except ValidationError as e:
-                        logger.debug(f"Failed to parse 'quote_completed' message: {e}")
-                    continue
+        All symbols are subscribed as separate series on a single chart session, so
+        one WebSocket handshake and one session setup serve every symbol. Each bar is
+        yielded together with the symbol it belongs to: first the ``bars_count``
+        historical bars of each symbol, then real-time updates as they arrive.
+        Symbols are automatically converted from EXCHANGE-SYMBOL to EXCHANGE:SYMBOL format.
 
-                elif message_type in ("series_loading", "study_loading"):
-                    logger.debug(f"{message_type} for real-time data stream")
-                    continue
+        Args:
+            exchange_symbols: Symbols in 'EXCHANGE:SYMBOL' or 'EXCHANGE-SYMBOL' format.
+            interval: The interval for the chart (default is "1" for 1 minute).
+            bars_count: The number of bars to fetch per symbol (default is 10).
 
-                elif message_type in ("series_completed", "study_completed"):
-                    logger.debug(f"{message_type} for real-time data stream")
-                    continue
+        Returns:
+            An async generator yielding ``(symbol, bar)`` tuples, where ``symbol`` is the
+            canonical EXCHANGE:SYMBOL string.
 
-                elif message_type == "series_error":
-                    logger.error("Series error received from TradingView")
-                    logger.error(f"Error details: {data}")
-                    logger.error(
-                        "Please check the interval - this timeframe may not be supported for the symbol"
-                    )
-                    logger.error("Also verify that bars_count is within valid range")
-                    if self.connection_service:
-                        await self.connection_service.close()
-                    raise ValueError(
-                        "TradingView series error: Invalid interval or bars count. "
-                        "Please check that the timeframe is supported for this symbol "
-                        "and that bars_count is within valid range."
-                    )
+        Raises:
+            ValueError: If no symbols are given, a symbol format is invalid, or
+                TradingView reports a series error
+            WebSocketException: If connection or streaming fails
+
+        Example:
+            >>> async with OHLCV() as client:
+            ...     symbols = ["BINANCE:BTCUSDT", "NASDAQ:AAPL"]
+            ...     async for symbol, bar in client.get_ohlcv_multi(symbols, interval="5"):
+            ...         print(f"{symbol}: close=${bar.close}")
+        """
+        canonical_symbols: list[str] = normalize_symbols(exchange_symbols)
+        if not canonical_symbols:
+            raise ValueError("get_ohlcv_multi() requires at least one symbol")
+        await validate_symbols(canonical_symbols)
+        validate_interval(interval)
+        await self._prepare_chart_session(
+            canonical_symbols[0],
+            interval,
+            bars_count,
+            extra_symbols=tuple(canonical_symbols[1:]),
+        )
+
+        if self.connection_service is None:
+            raise RuntimeError("Services not properly initialized")
+
+        # Series N on the chart session carries its bars under the key "sds_N".
+        series_symbols: dict[str, str] = {
+            f"sds_{series_index}": symbol
+            for series_index, symbol in enumerate(canonical_symbols, start=1)
+        }
+
+        async for data in self.connection_service.get_data_stream():
+            if not isinstance(data, dict):
+                continue
+            message_type: str | None = data.get("m")
+
+            if message_type == "series_error":
+                logger.error("Series error received from TradingView: %s", data)
+                await self.connection_service.close()
+                raise ValueError(
+                    "TradingView series error: Invalid interval or bars count. "
+                    "Please check that the timeframe is supported for every symbol "
+                    "and that bars_count is within valid range."
+                )
 
+            response: OHLCVResponse | TimescaleUpdateResponse
+            try:
+                if message_type == "du":
+                    response = _OHLCV_VALIDATOR.validate_python(data)
+                elif message_type == "timescale_update":
+                    response = _TS_VALIDATOR.validate_python(data)
                 else:
-                    logger.debug(f"Skipping message type '{message_type}': {data}")
+                    logger.debug("Skipping message type '%s' in multi-symbol stream", message_type)
                     continue
-
-            except Exception as e:
-                # Outer guard: skip unparseable messages (e.g. malformed WebSocket frames)
-                logger.debug(f"Skipping unparseable message: {data} - Error: {e}")
+                bars_by_series: dict[str, list[OHLCVBar]] = response.ohlcv_bars_by_series()
+            except ValueError as e:
+                # ValidationError, or a bar array of the wrong length in OHLCVBar.from_array.
+                logger.debug("Failed to parse '%s' message as OHLCV: %s", message_type, e)
                 continue
 
+            for series_id, bars in bars_by_series.items():
+                symbol: str | None = series_symbols.get(series_id)
+                if symbol is None:
+                    continue
+                for ohlcv_bar in bars:
+                    yield symbol, ohlcv_bar
+
     async def get_historical_ohlcv(
         self,
         exchange_symbol: str,
@@ -1336,7 +1653,7 @@ class OHLCV:
         else:
             raise ValueError("Either bars_count or both start and end must be provided.")
 
-    async def get_quote_data(
+    def get_quote_data(
         self, exchange_symbol: str, interval: str = "1", bars_count: int = 10
     ) -> AsyncGenerator[QuoteSymbolData, None]:
         """
@@ -1363,70 +1680,9 @@ class OHLCV:
             ...     async for quote in client.get_quote_data("NASDAQ:AAPL", interval="5"):
             ...         print(f"Price: ${quote.current_price}")
         """
-        canonical: str = normalize_symbol(exchange_symbol)
-        await validate_symbols(canonical)
-        validate_interval(interval)
-        await self._prepare_chart_session(canonical, interval, bars_count)
-
-        if self.connection_service is None:
-            raise RuntimeError("Services not properly initialized")
-
-        async for data in self.connection_service.get_data_stream():
-            try:
-                if not isinstance(data, dict):
-                    continue
-                message_type: str | None = data.get("m")
-
-                if message_type == "qsd":
-                    try:
-                        quote_data: QuoteSymbolData = QuoteSymbolData.model_validate(data)
-                        yield quote_data
-                    except ValidationError as e:
-                        logger.debug(f"Failed to parse 'qsd' message: {e}")
-                        continue
-
-                elif message_type == "quote_completed":
-                    try:
-                        quote_completed: QuoteCompletedMessage = (
-                            QuoteCompletedMessage.model_validate(data)
-                        )
-                        logger.info(f"Quote setup completed for symbol: {quote_completed.symbol}")
-                    except ValidationError as e:
-                        logger.debug(f"Failed to parse 'quote_completed' message: {e}")
-                    continue
-
-                elif message_type in (
-                    "series_loading",
-                    "study_loading",
-                    "series_completed",
-                    "study_completed",
-                ):
-                    logger.debug(f"{message_type} for quote data stream")
-                    continue
-
-                elif message_type == "series_error":
-                    logger.error("Series error received from TradingView during quote data stream")
-                    logger.error(f"Error details: {data}")
-                    logger.error(
-                        "Please check the interval - this timeframe may not be supported for the symbol"
-                    )
-                    logger.error("Also verify that bars_count is within valid range")
-                    if self.connection_service:
-                        await self.connection_service.close()
-                    raise ValueError(
-                        "TradingView series error: Invalid interval or bars count. "
-                        "Please check that the timeframe is supported for this symbol "
-                        "and that bars_count is within valid range."
-                    )
-
-                else:
-                    logger.debug(f"Skipping message type '{message_type}' in quote stream")
-                    continue
-
-            except Exception as e:
-                # Outer guard: skip unparseable messages (e.g. malformed WebSocket frames)
-                logger.debug(f"Skipping unparseable message in quote stream: {data} - Error: {e}")
-                continue
+        return self._stream(
+            exchange_symbol, interval, bars_count, _QUOTE_STREAM_HANDLERS, "quote data stream"
+        )
 
     async def get_ohlcv_raw(
         self, exchange_symbol: str, interval: str = "1", bars_count: int = 10
@@ -1455,15 +1711,7 @@ class OHLCV:
             ...     async for raw_data in client.get_ohlcv_raw("BINANCE:BTCUSDT", interval="5"):
             ...         print(f"Raw message: {raw_data}")
         """
-        canonical: str = normalize_symbol(exchange_symbol)
-        await validate_symbols(canonical)
-        validate_interval(interval)
-        await self._prepare_chart_session(canonical, interval, bars_count)
-
-        if self.connection_service is None:
-            raise RuntimeError("Services not properly initialized")
-
-        async for data in self.connection_service.get_data_stream():
+        async for data in await self._open_stream(exchange_symbol, interval, bars_count):
             yield data
 
     async def get_latest_trade_info(
@@ -1502,15 +1750,17 @@ class OHLCV:
 
         quote_session: str = self.message_service.generate_session(prefix="qs_")
         chart_session: str = self.message_service.generate_session(prefix="cs_")
-        logger.debug(f"Sessions: quote={quote_session}, chart={chart_session}")
+        logger.debug("Sessions: quote=%s, chart=%s", quote_session, chart_session)
 
-        send_message_func = self.message_service.get_send_message_callable()
+        # Queue the whole setup burst and deliver it in a single WebSocket send.
+        queue_message = self.message_service.queue_message
         await self.connection_service.initialize_sessions(
-            quote_session, chart_session, send_message_func
+            quote_session, chart_session, queue_message
         )
         await self.connection_service.add_multiple_symbols_to_sessions(
-            quote_session, canonical_symbols, send_message_func
+            quote_session, canonical_symbols, queue_message
         )
+        await self.message_service.flush()
 
         async for data in self.connection_service.get_data_stream():
             yield data
@@ -1,8 +1,8 @@
 """Services module for WebSocket stream functionality."""
 
-from tvkit.api.chart.services.connection_service import ConnectionService, ConnectionState
-from tvkit.api.chart.services.message_service import MessageService
-from tvkit.api.chart.services.segmented_fetch_service import SegmentedFetchService
+from .connection_service import ConnectionService, ConnectionState
+from .message_service import MessageService
+from .segmented_fetch_service import SegmentedFetchService
 
 __all__ = [
     "ConnectionService",
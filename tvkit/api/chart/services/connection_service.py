@@ -4,14 +4,16 @@ import asyncio
 import json
 import logging
 import re
-from collections.abc import AsyncGenerator, Awaitable, Callable
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import aclosing
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from websockets import ClientConnection
 from websockets.asyncio.client import connect
 from websockets.connection import State as WebSocketState
-from websockets.exceptions import ConnectionClosed, WebSocketException
+from websockets.exceptions import ConnectionClosed, ConnectionClosedOK, WebSocketException
+from websockets.typing import Data
 
 from tvkit.api.chart.exceptions import AuthError, StreamConnectionError
 from tvkit.api.chart.models.adjustment import Adjustment
@@ -21,6 +23,14 @@ from tvkit.api.chart.models.realtime import (
 )
 from tvkit.api.utils.retry import calculate_backoff_delay
 
+if TYPE_CHECKING:
+    import orjson
+else:
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
 logger: logging.Logger = logging.getLogger(__name__)
 
 # Protocol identifier constants for TradingView WebSocket series messages.
@@ -30,9 +40,140 @@ _SERIES_DATASOURCE_ID: str = "sds_1"
 _SERIES_ID: str = "s1"
 _SYMBOL_REF_ID: str = "sds_sym_1"
 
+# Fields requested by quote_set_fields; identical for every connection.
+_QUOTE_FIELDS: tuple[str, ...] = (
+    "ch",
+    "chp",
+    "current_session",
+    "description",
+    "local_description",
+    "language",
+    "exchange",
+    "fractional",
+    "is_tradable",
+    "lp",
+    "lp_time",
+    "minmov",
+    "minmove2",
+    "original_name",
+    "pricescale",
+    "pro_name",
+    "short_name",
+    "type",
+    "update_mode",
+    "volume",
+    "currency_code",
+    "rchp",
+    "rtc",
+)
+
+# Pre-serialized resolve_symbol payloads, including the "=" prefix TradingView
+# expects. Only the dynamic values are JSON-encoded per call; after the "=" the
+# output is byte-identical to json.dumps() of the equivalent dict.
+_RESOLVE_SYMBOL_TEMPLATE: str = (
+    '={{"adjustment": {adjustment}, "backadjustment": "default", "symbol": {symbol}}}'
+)
+_RESOLVE_MULTI_SYMBOL_TEMPLATE: str = (
+    '={{"adjustment": "splits", "currency-id": "USD", "session": "regular", "symbol": {symbol}}}'
+)
+
 # Precompiled patterns for TradingView WebSocket frame parsing.
-_HEARTBEAT_RE: re.Pattern[str] = re.compile(r"~m~\d+~m~~h~\d+$")
-_FRAME_SPLIT_RE: re.Pattern[str] = re.compile(r"~m~\d+~m~")
+# Frames are handled as bytes throughout, so patterns are bytes patterns.
+_HEARTBEAT_RE: re.Pattern[bytes] = re.compile(rb"~m~\d+~m~~h~\d+$")
+# Heartbeats (e.g. ``~m~4~m~~h~1``) are tiny; longer frames skip the regex entirely.
+_HEARTBEAT_MAX_LEN: int = 64
+
+# Delimiter around the length prefix of each ``~m~<len>~m~<payload>`` record.
+_FRAME_DELIMITER: bytes = b"~m~"
+
+
+def _iter_frames(buf: bytes) -> Iterator[memoryview]:
+    """
+    Yield the payload of each ``~m~<len>~m~<payload>`` record in a raw frame.
+
+    Payloads are zero-copy ``memoryview`` slices of *buf*. The declared length is
+    TradingView's JavaScript string length, which only equals the byte length for
+    ASCII payloads. It is trusted when it ends exactly at the next record header or
+    at the end of the buffer; otherwise the payload runs to the next ``~m~``.
+    Text that does not start with a record header is yielded up to the next
+    delimiter so the caller's JSON error handling reports it. Empty payloads are
+    skipped.
+
+    Args:
+        buf: One raw WebSocket message, possibly holding several records.
+
+    Yields:
+        The payload of each record, in order.
+    """
+    view: memoryview = memoryview(buf)
+    find = buf.find
+    startswith = buf.startswith
+    size: int = len(buf)
+    pos: int = 0
+    while pos < size:
+        if startswith(_FRAME_DELIMITER, pos):
+            length_end: int = find(_FRAME_DELIMITER, pos + 3)
+            length_digits: bytes = buf[pos + 3 : length_end]
+            if length_end != -1 and length_digits.isdigit():
+                start: int = length_end + 3
+                end: int = start + int(length_digits)
+                if end != size and not startswith(_FRAME_DELIMITER, end):
+                    end = find(_FRAME_DELIMITER, start)
+                    if end == -1:
+                        end = size
+                if end > start:
+                    yield view[start:end]
+                pos = max(end, start)
+                continue
+        end = find(_FRAME_DELIMITER, pos + 1)
+        if end == -1:
+            end = size
+        yield view[pos:end]
+        pos = end
+
+
+def _loads_json(data: str | bytes | memoryview) -> Any:
+    """
+    Parse one TradingView JSON payload, using ``orjson`` when it is installed.
+
+    Payloads ``orjson`` rejects but the standard library accepts (``NaN``,
+    integers wider than 64 bits) fall back to ``json.loads``.
+
+    Args:
+        data: A single JSON document as ``str`` or UTF-8 bytes (``bytes`` or
+            ``memoryview``).
+
+    Returns:
+        The parsed JSON value.
+
+    Raises:
+        json.JSONDecodeError: If the payload is not valid JSON.
+        UnicodeDecodeError: If ``bytes`` input is not valid UTF-8.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+class _RawFrameClientConnection(ClientConnection):
+    """
+    ``ClientConnection`` whose iterator yields frames without UTF-8 decoding.
+
+    TradingView sends its protocol as text frames. The default iterator decodes
+    (and thereby validates) every text frame into ``str`` before the reader task
+    sees it; this variant yields the undecoded ``bytes`` instead so decoding is
+    deferred to the consumer, which can work on bytes directly.
+    """
+
+    async def __aiter__(self) -> AsyncIterator[Data]:
+        try:
+            while True:
+                yield await self.recv(decode=False)
+        except ConnectionClosedOK:
+            return
 
 
 class ConnectionState(Enum):
@@ -89,7 +230,8 @@ class ConnectionService:
         self._on_reconnect: Callable[[], Awaitable[None]] | None = on_reconnect
         self._reader_task: asyncio.Task[None] | None = None
         # maxsize=1000 bounds memory when consumer lags; put() blocks on full (backpressure).
-        self._message_queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=1000)
+        # Items are undecoded WebSocket frames; decoding and parsing happen in the consumer.
+        self._message_queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=1000)
         # Lock held for the ENTIRE retry loop to block concurrent reconnect callers.
         self._reconnect_lock: asyncio.Lock = asyncio.Lock()
 
@@ -159,7 +301,9 @@ class ConnectionService:
             close_timeout=10,
             max_size=None,
         )
-        self._ws = await connect(**ws_config.model_dump())
+        self._ws = await connect(
+            **ws_config.model_dump(), create_connection=_RawFrameClientConnection
+        )
 
     async def _connect(self) -> None:
         """Open WebSocket with a configurable timeout.
@@ -223,9 +367,9 @@ class ConnectionService:
     async def _read_raw_loop(self) -> None:
         """Read raw messages from WebSocket, echo heartbeats, feed data frames to queue.
 
-        Runs as a background task (``_reader_task``). Puts raw message strings into
-        ``_message_queue``. The consumer (``get_data_stream``) handles JSON parsing and
-        frame splitting.
+        Runs as a background task (``_reader_task``). Puts raw frames into
+        ``_message_queue`` as undecoded ``bytes`` so the reader only does I/O. The
+        consumer (``get_data_stream``) handles frame splitting and JSON parsing.
 
         The ``None`` sentinel placed in the ``finally`` block signals the consumer that
         the stream has ended. It is suppressed (not placed) when ``_state`` is
@@ -236,28 +380,31 @@ class ConnectionService:
         the queue is at capacity. A ``QueueFull`` exception is silently suppressed —
         ``close()`` handles teardown regardless of whether the sentinel is delivered.
         """
-        if self._ws is None:
+        ws: ClientConnection | None = self._ws
+        if ws is None:
             return
+        # Bound once: this loop runs for every inbound frame.
+        match_heartbeat = _HEARTBEAT_RE.match
+        send = ws.send
+        put = self._message_queue.put
         try:
-            async for message in self._ws:
-                raw: str
-                if isinstance(message, str):
-                    raw = message
-                elif isinstance(message, bytes):
-                    raw = message.decode("utf-8")
-                else:
-                    raw = bytes(message).decode("utf-8")
+            async for message in ws:
+                # _RawFrameClientConnection yields bytes; str only arrives from a
+                # connection that decodes frames itself.
+                raw: bytes = message.encode("utf-8") if isinstance(message, str) else bytes(message)
 
-                if _HEARTBEAT_RE.match(raw):
+                if len(raw) <= _HEARTBEAT_MAX_LEN and match_heartbeat(raw) is not None:
                     logger.debug("Received heartbeat: %s", raw)
+                    # Echo the frame as received. ``text=True`` sends undecoded bytes
+                    # as a text frame, avoiding a decode/encode round-trip.
                     try:
-                        await self._ws.send(raw)
+                        await send(raw, text=True)
                     except ConnectionClosed:
                         logger.debug("Connection closed while echoing heartbeat")
                         break
                 else:
                     # Blocks when queue is full — provides backpressure to the reader.
-                    await self._message_queue.put(raw)
+                    await put(raw)
 
         except ConnectionClosed as exc:
             if not self._closing:
@@ -379,13 +526,50 @@ class ConnectionService:
 
         return False
 
+    async def _iter_payloads(self) -> AsyncGenerator[memoryview, None]:
+        """
+        Yield the raw JSON payload of each TradingView record, unparsed.
+
+        Reads from the internal message queue fed by the background reader task,
+        splits each WebSocket message into its ``~m~<len>~m~<payload>`` records and
+        yields every payload as a ``memoryview`` of the received bytes. Heartbeats
+        never reach this point; the reader echoes them. Reconnects automatically on
+        unexpected disconnections using exponential backoff.
+
+        Yields:
+            The undecoded UTF-8 JSON payload of each record, in arrival order.
+
+        Raises:
+            StreamConnectionError: If reconnection is exhausted after all attempts.
+        """
+        # Bound once: this loop runs for every inbound frame.
+        get = self._message_queue.get
+        iter_frames = _iter_frames
+
+        while True:
+            raw: bytes | None = await get()
+
+            if raw is None:
+                if self._closing:
+                    return
+                # Unexpected disconnect — attempt reconnect.
+                try:
+                    await self._reconnect_with_backoff()
+                except StreamConnectionError:
+                    raise
+                continue  # new reader is running; resume consuming from queue
+
+            # Frames stay as bytes end-to-end; both JSON parsers accept bytes.
+            for item in iter_frames(raw):
+                yield item
+
     async def get_data_stream(self) -> AsyncGenerator[dict[str, Any], None]:
         """
         Yield parsed TradingView WebSocket frames.
 
-        Reads from the internal message queue fed by the background reader task.
-        Reconnects automatically on unexpected disconnections using exponential
-        backoff. Yields parsed JSON dicts; skips malformed frames with a warning.
+        Parses each payload from ``_iter_payloads()`` as JSON. Reconnects
+        automatically on unexpected disconnections using exponential backoff.
+        Yields parsed JSON dicts; skips malformed frames with a warning.
 
         Yields:
             Parsed TradingView WebSocket frames as parsed JSON dicts.
@@ -400,38 +584,28 @@ class ConnectionService:
         if self._ws is None:
             raise RuntimeError("WebSocket connection not established")
 
-        try:
-            while True:
-                raw: str | None = await self._message_queue.get()
+        # Bound once: this loop runs for every inbound frame.
+        loads = _loads_json
+        is_auth_error = self._is_auth_error
 
-                if raw is None:
-                    if self._closing:
-                        break
-                    # Unexpected disconnect — attempt reconnect.
+        try:
+            async with aclosing(self._iter_payloads()) as payloads:
+                async for item in payloads:
                     try:
-                        await self._reconnect_with_backoff()
-                    except StreamConnectionError:
-                        raise
-                    continue  # new reader is running; resume consuming from queue
-
-                split_result: list[str] = [x for x in _FRAME_SPLIT_RE.split(raw) if x]
-                for item in split_result:
-                    if item:
-                        try:
-                            parsed: object = json.loads(item)
-                        except json.JSONDecodeError:
-                            logger.warning("Failed to parse JSON: %s", item)
-                            continue
-                        if isinstance(parsed, dict) and self._is_auth_error(parsed):
-                            logger.error(
-                                "WebSocket authentication error — token rejected by TradingView.",
-                                extra={"m": parsed.get("m")},
-                            )
-                            raise AuthError(
-                                "TradingView rejected the authentication token. "
-                                "Re-enter the OHLCV context manager with fresh credentials."
-                            )
-                        yield parsed  # type: ignore[misc]
+                        parsed: object = loads(item)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        logger.warning("Failed to parse JSON: %s", bytes(item))
+                        continue
+                    if isinstance(parsed, dict) and is_auth_error(parsed):
+                        logger.error(
+                            "WebSocket authentication error — token rejected by TradingView.",
+                            extra={"m": parsed.get("m")},
+                        )
+                        raise AuthError(
+                            "TradingView rejected the authentication token. "
+                            "Re-enter the OHLCV context manager with fresh credentials."
+                        )
+                    yield parsed  # type: ignore[misc]
         finally:
             await self.close()
 
@@ -457,42 +631,9 @@ class ConnectionService:
         await send_message_func("set_locale", ["en", "US"])
         await send_message_func("chart_create_session", [chart_session, ""])
         await send_message_func("quote_create_session", [quote_session])
-        await send_message_func("quote_set_fields", [quote_session, *self._get_quote_fields()])
+        await send_message_func("quote_set_fields", [quote_session, *_QUOTE_FIELDS])
         await send_message_func("quote_hibernate_all", [quote_session])
 
-    def _get_quote_fields(self) -> list[str]:
-        """
-        Returns the fields to be set for the quote session.
-
-        Returns:
-            A list of fields for the quote session.
-        """
-        return [
-            "ch",
-            "chp",
-            "current_session",
-            "description",
-            "local_description",
-            "language",
-            "exchange",
-            "fractional",
-            "is_tradable",
-            "lp",
-            "lp_time",
-            "minmov",
-            "minmove2",
-            "original_name",
-            "pricescale",
-            "pro_name",
-            "short_name",
-            "type",
-            "update_mode",
-            "volume",
-            "currency_code",
-            "rchp",
-            "rtc",
-        ]
-
     def _create_series_args(
         self,
         chart_session: str,
@@ -505,9 +646,9 @@ class ConnectionService:
         The parameter order and count are protocol-critical. The trailing empty string
         must always be present — omitting it silently breaks the TradingView protocol.
 
-        Note: tvkit currently supports a single series per chart session. The series
-        identifiers (_SERIES_ID, _SERIES_DATASOURCE_ID, _SYMBOL_REF_ID) are fixed
-        constants that match this single-series design.
+        Note: these are the identifiers of the first series on a chart session. The
+        series identifiers (_SERIES_ID, _SERIES_DATASOURCE_ID, _SYMBOL_REF_ID) are fixed
+        constants for it; further series are added by add_series_to_sessions().
 
         Args:
             chart_session: The chart session identifier (e.g. "cs_abcdefghijkl").
@@ -620,17 +761,11 @@ class ConnectionService:
                 is always included in the payload — present in every TradingView
                 browser request per HAR analysis.
         """
-        resolve_symbol: str = json.dumps(
-            {
-                "adjustment": adjustment.value,
-                "backadjustment": "default",
-                "symbol": exchange_symbol,
-            }
-        )
-        await send_message_func("quote_add_symbols", [quote_session, f"={resolve_symbol}"])
-        await send_message_func(
-            "resolve_symbol", [chart_session, _SYMBOL_REF_ID, f"={resolve_symbol}"]
+        resolve_symbol: str = _RESOLVE_SYMBOL_TEMPLATE.format(
+            adjustment=json.dumps(adjustment.value), symbol=json.dumps(exchange_symbol)
         )
+        await send_message_func("quote_add_symbols", [quote_session, resolve_symbol])
+        await send_message_func("resolve_symbol", [chart_session, _SYMBOL_REF_ID, resolve_symbol])
         await send_message_func(
             "create_series",
             self._create_series_args(chart_session, timeframe, bars_count),
@@ -654,6 +789,63 @@ class ConnectionService:
         )
         await send_message_func("quote_hibernate_all", [quote_session])
 
+    async def add_series_to_sessions(
+        self,
+        quote_session: str,
+        chart_session: str,
+        exchange_symbol: str,
+        timeframe: str,
+        bars_count: int,
+        series_index: int,
+        send_message_func: Callable[[str, list[Any]], Awaitable[None]],
+        *,
+        adjustment: Adjustment = Adjustment.SPLITS,
+    ) -> None:
+        """
+        Adds another symbol to sessions already set up by ``add_symbol_to_sessions()``.
+
+        The symbol becomes chart series ``series_index`` on the same chart session:
+        its bars arrive in ``du``/``timescale_update`` frames keyed by
+        ``"sds_<series_index>"``. Only count mode is supported, and no volume study
+        is attached (bars already carry volume).
+
+        Args:
+            quote_session: The quote session identifier.
+            chart_session: The chart session identifier.
+            exchange_symbol: The symbol in 'EXCHANGE:SYMBOL' format.
+            timeframe: The timeframe for the chart (e.g. ``"1D"``).
+            bars_count: Number of bars to fetch for the chart.
+            series_index: Series number on the chart session; 2 or higher, since
+                series 1 is the one created by ``add_symbol_to_sessions()``.
+            send_message_func: Function to send messages through the WebSocket.
+            adjustment: Price adjustment mode for the ``resolve_symbol`` payload.
+
+        Raises:
+            ValueError: If ``series_index`` is lower than 2.
+        """
+        if series_index < 2:
+            raise ValueError(f"series_index must be 2 or higher, got {series_index}")
+
+        symbol_ref_id: str = f"sds_sym_{series_index}"
+        resolve_symbol: str = _RESOLVE_SYMBOL_TEMPLATE.format(
+            adjustment=json.dumps(adjustment.value), symbol=json.dumps(exchange_symbol)
+        )
+        await send_message_func("quote_add_symbols", [quote_session, resolve_symbol])
+        await send_message_func("resolve_symbol", [chart_session, symbol_ref_id, resolve_symbol])
+        await send_message_func(
+            "create_series",
+            [
+                chart_session,
+                f"sds_{series_index}",
+                f"s{series_index}",
+                symbol_ref_id,
+                timeframe,
+                bars_count,
+                "",
+            ],
+        )
+        await send_message_func("quote_fast_symbols", [quote_session, exchange_symbol])
+
     async def add_multiple_symbols_to_sessions(
         self,
         quote_session: str,
@@ -668,16 +860,11 @@ class ConnectionService:
             exchange_symbols: List of symbols in 'EXCHANGE:SYMBOL' format
             send_message_func: Function to send messages through the WebSocket
         """
-        resolve_symbol: str = json.dumps(
-            {
-                "adjustment": "splits",
-                "currency-id": "USD",
-                "session": "regular",
-                "symbol": exchange_symbols[0],
-            }
+        resolve_symbol: str = _RESOLVE_MULTI_SYMBOL_TEMPLATE.format(
+            symbol=json.dumps(exchange_symbols[0])
         )
-        await send_message_func("quote_add_symbols", [quote_session, f"={resolve_symbol}"])
-        await send_message_func("quote_fast_symbols", [quote_session, f"={resolve_symbol}"])
+        await send_message_func("quote_add_symbols", [quote_session, resolve_symbol])
+        await send_message_func("quote_fast_symbols", [quote_session, resolve_symbol])
 
         await send_message_func("quote_add_symbols", [quote_session] + exchange_symbols)
         await send_message_func("quote_fast_symbols", [quote_session] + exchange_symbols)
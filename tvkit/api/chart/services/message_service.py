@@ -24,13 +24,14 @@ invariant at the ``OHLCVBar`` model boundary via a Pydantic timestamp validator.
 import json
 import logging
 import secrets
-import string
 from collections.abc import Awaitable, Callable
 from typing import Any
 
 from websockets import ClientConnection
 from websockets.exceptions import ConnectionClosed, WebSocketException
 
+logger: logging.Logger = logging.getLogger(__name__)
+
 
 class MessageService:
     """
@@ -55,6 +56,8 @@ class MessageService:
             ws: The WebSocket connection to use for sending messages
         """
         self.ws: ClientConnection = ws
+        # Encoded frames waiting for flush(); see queue_message().
+        self._pending: list[bytes] = []
 
     def generate_session(self, prefix: str) -> str:
         """
@@ -64,10 +67,10 @@ class MessageService:
             prefix: The prefix to prepend to the random string.
 
         Returns:
-            A session identifier consisting of the prefix and a random string.
+            A session identifier consisting of the prefix and 12 random hex characters.
         """
-        random_string: str = "".join(secrets.choice(string.ascii_lowercase) for _ in range(12))
-        return prefix + random_string
+        # 6 random bytes as 12 lowercase hex characters, drawn in one call.
+        return prefix + secrets.token_hex(6)
 
     def prepend_header(self, message: str) -> str:
         """
@@ -93,7 +96,7 @@ class MessageService:
         Returns:
             The constructed JSON message.
         """
-        return json.dumps({"m": func, "p": param_list}, separators=(",", ":"))
+        return self._encode_body(func, param_list).decode("ascii")
 
     def create_message(self, func: str, param_list: list[Any]) -> str:
         """
@@ -106,7 +109,46 @@ class MessageService:
         Returns:
             The complete message ready to be sent.
         """
-        return self.prepend_header(self.construct_message(func, param_list))
+        return self._encode_message(func, param_list).decode("ascii")
+
+    def _encode_body(self, func: str, param_list: list[Any]) -> bytes:
+        """
+        Encodes the ``{"m": func, "p": param_list}`` message body as compact JSON.
+
+        Only the function name and the parameter list go through the encoder; the
+        envelope is a fixed format. ``json.dumps`` escapes all non-ASCII characters
+        by default, so the body is pure ASCII and its byte length equals the
+        character length TradingView expects in the header.
+
+        Args:
+            func: The function name to be called.
+            param_list: The list of parameters for the function.
+
+        Returns:
+            The JSON message body as bytes.
+        """
+        name: bytes = json.dumps(func).encode("ascii")
+        params: bytes = json.dumps(param_list, separators=(",", ":")).encode("ascii")
+        return b'{"m":%s,"p":%s}' % (name, params)
+
+    def _encode_message(self, func: str, param_list: list[Any]) -> bytes:
+        """
+        Creates the framed ``~m~<len>~m~<body>`` message as bytes.
+
+        This is the framing used by ``send_message()`` and ``queue_message()``;
+        ``create_message()`` and ``construct_message()`` return its text form.
+        The frame is sent as a text frame without the WebSocket library having to
+        encode a ``str`` first.
+
+        Args:
+            func: The function name to be called.
+            param_list: The list of parameters for the function.
+
+        Returns:
+            The complete framed message as bytes.
+        """
+        body: bytes = self._encode_body(func, param_list)
+        return b"~m~%d~m~%s" % (len(body), body)
 
     async def send_message(self, func: str, args: list[Any]) -> None:
         """
@@ -124,16 +166,67 @@ class MessageService:
         if not self.ws:
             raise RuntimeError("WebSocket connection not established. Call _connect() first.")
 
-        message: str = self.create_message(func, args)
-        logging.debug("Sending message: %s", message)
+        await self._send_raw(self._encode_message(func, args))
+
+    async def queue_message(self, func: str, args: list[Any]) -> None:
+        """
+        Frames a message and holds it until the next ``flush()``.
+
+        TradingView accepts several ``~m~<len>~m~<body>`` records concatenated in a
+        single WebSocket message, so a burst of setup messages can be delivered
+        with one ``ws.send`` instead of one per message. This is a coroutine so it
+        can be passed anywhere a ``send_message`` callable is expected.
+
+        Args:
+            func: The function name to be called.
+            args: The arguments for the function.
+        """
+        self._pending.append(self._encode_message(func, args))
+
+    async def flush(self) -> None:
+        """
+        Sends all queued messages as a single WebSocket message.
+
+        Does nothing when no messages are queued. The queue is cleared before
+        sending, so a failed flush does not resend the same messages later.
+
+        Raises:
+            RuntimeError: If WebSocket connection is not established
+            ConnectionClosed: If WebSocket connection is closed
+            WebSocketException: If sending fails
+        """
+        if not self._pending:
+            return
+        if not self.ws:
+            raise RuntimeError("WebSocket connection not established. Call _connect() first.")
+
+        message: bytes = b"".join(self._pending)
+        self._pending.clear()
+        await self._send_raw(message)
+
+    async def _send_raw(self, message: bytes) -> None:
+        """
+        Sends an already-framed message to the WebSocket server as a text frame.
+
+        Args:
+            message: One or more framed TradingView messages, UTF-8 encoded.
+
+        Raises:
+            ConnectionClosed: If WebSocket connection is closed
+            WebSocketException: If sending fails
+        """
+        # Guarded so large outbound payloads are never touched by the logging
+        # machinery when DEBUG is disabled.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending message: %s", message.decode("utf-8"))
 
         try:
-            await self.ws.send(message)
+            await self.ws.send(message, text=True)
         except ConnectionClosed as e:
-            logging.error("WebSocket connection closed while sending message: %s", e)
+            logger.error("WebSocket connection closed while sending message: %s", e)
             raise
         except WebSocketException as e:
-            logging.error("Failed to send message: %s", e)
+            logger.error("Failed to send message: %s", e)
             raise
 
     def get_send_message_callable(self) -> Callable[[str, list[Any]], Awaitable[None]]:
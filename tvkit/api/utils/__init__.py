@@ -32,7 +32,9 @@ from .models import (
 from .retry import calculate_backoff_delay
 from .symbol_validator import (
     SymbolValidationOutcome,
+    clear_symbol_cache,
     convert_symbol_format,
+    shared_http_client,
     validate_symbol_detailed,
     validate_symbols,
 )
@@ -44,6 +46,8 @@ __all__ = [
     "convert_timestamp_to_iso",
     "validate_symbols",
     "validate_symbol_detailed",
+    "shared_http_client",
+    "clear_symbol_cache",
     "convert_symbol_format",
     "SymbolValidationOutcome",
     "fetch_tradingview_indicators",
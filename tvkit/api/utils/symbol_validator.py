@@ -8,6 +8,10 @@ API to ensure they follow the correct format and exist in TradingView's system.
 import asyncio
 import logging
 import warnings
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 
 import httpx
 from pydantic import BaseModel, Field
@@ -16,6 +20,82 @@ from .models import SymbolConversionResult
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Symbols TradingView has already confirmed in this process, least recently used
+# first. validate_symbols() skips them, so repeated stream/fetch calls for the same
+# symbol cost no request. Only confirmations are remembered; rejections and
+# transport failures are retried. See clear_symbol_cache().
+_validated_symbols: OrderedDict[str, None] = OrderedDict()
+
+# Upper bound on remembered symbols; the least recently used one is dropped first.
+_VALIDATED_SYMBOLS_MAXSIZE: int = 4096
+
+# Upper bound on symbols validate_symbols() checks concurrently. Each check is one
+# page request to tradingview.com, so this keeps a long symbol list from opening
+# dozens of connections at once.
+_MAX_CONCURRENT_VALIDATIONS: int = 8
+
+# Client installed by shared_http_client() for the current context, if any.
+_shared_client: ContextVar[httpx.AsyncClient | None] = ContextVar(
+    "tvkit_symbol_validation_client", default=None
+)
+
+
+def clear_symbol_cache() -> None:
+    """
+    Forget every symbol confirmed by earlier ``validate_symbols()`` calls.
+
+    Confirmed symbols are remembered for the life of the process (up to 4096,
+    least recently used dropped first). Call this to force them to be checked
+    against TradingView again, e.g. in a long-running service after a symbol
+    may have been delisted.
+    """
+    _validated_symbols.clear()
+
+
+def _remember_validated(symbol: str) -> None:
+    """Record a confirmed symbol, evicting the least recently used beyond the bound."""
+    _validated_symbols[symbol] = None
+    _validated_symbols.move_to_end(symbol)
+    if len(_validated_symbols) > _VALIDATED_SYMBOLS_MAXSIZE:
+        _validated_symbols.popitem(last=False)
+
+
+@asynccontextmanager
+async def shared_http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Share one HTTP client between all symbol validations inside the ``async with`` block.
+
+    Without it, every ``validate_symbols()`` and ``validate_symbol_detailed()`` call
+    opens and closes its own ``httpx.AsyncClient``, paying a new TLS handshake each
+    time. Inside the block they reuse this client's connection pool. The client is
+    visible to tasks created inside the block and is closed on exit.
+
+    Yields:
+        The shared ``httpx.AsyncClient``.
+
+    Example:
+        >>> async with shared_http_client():
+        ...     for symbol in ["NASDAQ:AAPL", "NASDAQ:MSFT"]:
+        ...         await validate_symbol_detailed(symbol)
+    """
+    async with httpx.AsyncClient(timeout=5.0) as client:
+        token = _shared_client.set(client)
+        try:
+            yield client
+        finally:
+            _shared_client.reset(token)
+
+
+@asynccontextmanager
+async def _validation_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the shared client if one is installed, else a client for this call only."""
+    shared: httpx.AsyncClient | None = _shared_client.get()
+    if shared is not None:
+        yield shared
+        return
+    async with httpx.AsyncClient(timeout=5.0) as client:
+        yield client
+
 
 class SymbolValidationOutcome(BaseModel):
     """Structured result of a single-symbol validation check.
@@ -42,13 +122,82 @@ class SymbolValidationOutcome(BaseModel):
     )
 
 
+async def _validate_symbol(
+    client: httpx.AsyncClient, item: str, semaphore: asyncio.Semaphore
+) -> None:
+    """
+    Validate one symbol against TradingView, retrying transport and server failures.
+
+    Args:
+        client: HTTP client shared by all symbols of one ``validate_symbols()`` call
+            (or by the enclosing ``shared_http_client()`` block).
+        item: Symbol to validate.
+        semaphore: Bounds the number of symbols checked at the same time.
+
+    Raises:
+        ValueError: If TradingView rejects the symbol (HTTP 404) or it cannot be
+                    validated after the allowed number of retries.
+    """
+    validate_url: str = "https://www.tradingview.com/symbols/{exchange_symbol}"
+
+    async with semaphore:
+        retries: int = 3
+
+        for attempt in range(retries):
+            try:
+                response: httpx.Response = await client.get(
+                    url=validate_url.format(exchange_symbol=item)
+                )
+
+                # Consider both 200 and 301 status codes as valid
+                if response.status_code in [200, 301]:
+                    _remember_validated(item)
+                    break  # Valid symbol, exit retry loop
+                elif response.status_code == 404:
+                    raise ValueError(f"Invalid exchange or symbol or index '{item}'")
+                else:
+                    response.raise_for_status()
+
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code == 404:
+                    raise ValueError(f"Invalid exchange or symbol or index '{item}'") from exc
+
+                logging.warning(
+                    "Attempt %d failed to validate symbol '%s': %s",
+                    attempt + 1,
+                    item,
+                    exc,
+                )
+
+                if attempt < retries - 1:
+                    await asyncio.sleep(delay=1.0)  # Wait briefly before retrying
+                else:
+                    raise ValueError(f"Invalid symbol '{item}' after {retries} attempts") from exc
+            except httpx.RequestError as exc:
+                logging.warning(
+                    "Attempt %d failed to validate symbol '%s': %s",
+                    attempt + 1,
+                    item,
+                    exc,
+                )
+
+                if attempt < retries - 1:
+                    await asyncio.sleep(delay=1.0)  # Wait briefly before retrying
+                else:
+                    raise ValueError(f"Invalid symbol '{item}' after {retries} attempts") from exc
+
+
 async def validate_symbols(exchange_symbol: str | list[str]) -> bool:
     """
     Validate one or more exchange symbols asynchronously.
 
     This function validates trading symbols by making requests to TradingView's
     symbol URL endpoint. Symbols can be in various formats including "EXCHANGE:SYMBOL"
-    format or other TradingView-compatible formats like "USI-PCC".
+    format or other TradingView-compatible formats like "USI-PCC". Symbols are
+    checked concurrently over one HTTP client. A failure cancels the checks of the
+    symbols after it in the list, and the error reported is that of the first
+    failing symbol in input order, as with a sequential check. Symbols confirmed by an earlier call in the same process
+    are not requested again (see ``clear_symbol_cache()``).
 
     Args:
         exchange_symbol: A single symbol or a list of symbols to validate.
@@ -70,8 +219,6 @@ async def validate_symbols(exchange_symbol: str | list[str]) -> bool:
         >>> await validate_symbols("NASDAQ:AAPL")
         True
     """
-    validate_url: str = "https://www.tradingview.com/symbols/{exchange_symbol}"
-
     if not exchange_symbol:
         raise ValueError("exchange_symbol cannot be empty")
 
@@ -81,55 +228,50 @@ async def validate_symbols(exchange_symbol: str | list[str]) -> bool:
     else:
         symbols = exchange_symbol
 
-    async with httpx.AsyncClient(timeout=5.0) as client:
-        for item in symbols:
-            retries: int = 3
-
-            for attempt in range(retries):
-                try:
-                    response: httpx.Response = await client.get(
-                        url=validate_url.format(exchange_symbol=item)
-                    )
-
-                    # Consider both 200 and 301 status codes as valid
-                    if response.status_code in [200, 301]:
-                        break  # Valid symbol, exit retry loop
-                    elif response.status_code == 404:
-                        raise ValueError(f"Invalid exchange or symbol or index '{item}'")
-                    else:
-                        response.raise_for_status()
-
-                except httpx.HTTPStatusError as exc:
-                    if exc.response.status_code == 404:
-                        raise ValueError(f"Invalid exchange or symbol or index '{item}'") from exc
-
-                    logging.warning(
-                        "Attempt %d failed to validate symbol '%s': %s",
-                        attempt + 1,
-                        item,
-                        exc,
-                    )
-
-                    if attempt < retries - 1:
-                        await asyncio.sleep(delay=1.0)  # Wait briefly before retrying
-                    else:
-                        raise ValueError(
-                            f"Invalid symbol '{item}' after {retries} attempts"
-                        ) from exc
-                except httpx.RequestError as exc:
-                    logging.warning(
-                        "Attempt %d failed to validate symbol '%s': %s",
-                        attempt + 1,
-                        item,
-                        exc,
-                    )
-
-                    if attempt < retries - 1:
-                        await asyncio.sleep(delay=1.0)  # Wait briefly before retrying
-                    else:
-                        raise ValueError(
-                            f"Invalid symbol '{item}' after {retries} attempts"
-                        ) from exc
+    pending: list[str] = []
+    for item in dict.fromkeys(symbols):
+        if item in _validated_symbols:
+            _validated_symbols.move_to_end(item)
+        else:
+            pending.append(item)
+    symbols = pending
+    if not symbols:
+        return True
+
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(_MAX_CONCURRENT_VALIDATIONS)
+    async with _validation_client() as client:
+        tasks: list[asyncio.Task[None]] = [
+            asyncio.create_task(_validate_symbol(client, item, semaphore)) for item in symbols
+        ]
+        try:
+            running: set[asyncio.Task[None]] = set(tasks)
+            while running:
+                _, running = await asyncio.wait(running, return_when=asyncio.FIRST_EXCEPTION)
+                failed: int | None = next(
+                    (
+                        index
+                        for index, task in enumerate(tasks)
+                        if task.done() and not task.cancelled() and task.exception() is not None
+                    ),
+                    None,
+                )
+                if failed is not None:
+                    # Every failure is final (a 404, or retries exhausted). Symbols after
+                    # the earliest failure cannot change the outcome, so they are cancelled
+                    # instead of running through their retries; earlier ones still finish.
+                    for task in tasks[failed + 1 :]:
+                        task.cancel()
+                    running = {task for task in tasks[:failed] if not task.done()}
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Report the first failing symbol in input order, as the sequential check did.
+    for task in tasks:
+        error: BaseException | None = None if task.cancelled() else task.exception()
+        if error is not None:
+            raise error
 
     return True
 
@@ -158,7 +300,7 @@ async def validate_symbol_detailed(symbol: str) -> SymbolValidationOutcome:
     validate_url: str = "https://www.tradingview.com/symbols/{exchange_symbol}"
     retries: int = 3
 
-    async with httpx.AsyncClient(timeout=5.0) as client:
+    async with _validation_client() as client:
         for attempt in range(retries):
             try:
                 response: httpx.Response = await client.get(
@@ -10,7 +10,7 @@ import websockets.exceptions
 
 from tvkit.api.chart.exceptions import NoHistoricalDataError, StreamConnectionError
 from tvkit.api.chart.ohlcv import OHLCV
-from tvkit.api.utils.symbol_validator import validate_symbol_detailed
+from tvkit.api.utils.symbol_validator import shared_http_client, validate_symbol_detailed
 from tvkit.batch.exceptions import BatchDownloadError
 from tvkit.batch.models import (
     BatchDownloadRequest,
@@ -76,43 +76,45 @@ async def _preflight_validate(
     valid: list[str] = []
     prefailed: list[SymbolResult] = []
 
-    for symbol in symbols:
-        t0 = time.monotonic()
-        outcome = await validate_symbol_detailed(symbol)
+    # One connection pool for every pre-flight request of the batch.
+    async with shared_http_client():
+        for symbol in symbols:
+            t0 = time.monotonic()
+            outcome = await validate_symbol_detailed(symbol)
 
-        if outcome.is_valid:
-            valid.append(symbol)
-            continue
+            if outcome.is_valid:
+                valid.append(symbol)
+                continue
 
-        if outcome.is_known_invalid:
-            logger.warning(
-                "Symbol failed pre-flight validation — skipping fetch",
-                extra={"symbol": symbol, "reason": outcome.message},
-            )
-            prefailed.append(
-                SymbolResult(
-                    symbol=symbol,
-                    bars=[],
-                    success=False,
-                    error=ErrorInfo(
-                        message=(
-                            outcome.message or f"Symbol '{symbol}' failed pre-flight validation"
+            if outcome.is_known_invalid:
+                logger.warning(
+                    "Symbol failed pre-flight validation — skipping fetch",
+                    extra={"symbol": symbol, "reason": outcome.message},
+                )
+                prefailed.append(
+                    SymbolResult(
+                        symbol=symbol,
+                        bars=[],
+                        success=False,
+                        error=ErrorInfo(
+                            message=(
+                                outcome.message or f"Symbol '{symbol}' failed pre-flight validation"
+                            ),
+                            exception_type=SYMBOL_VALIDATION_ERROR_TYPE,
+                            attempt=0,
                         ),
-                        exception_type=SYMBOL_VALIDATION_ERROR_TYPE,
-                        attempt=0,
-                    ),
-                    attempts=0,
-                    elapsed_seconds=time.monotonic() - t0,
+                        attempts=0,
+                        elapsed_seconds=time.monotonic() - t0,
+                    )
                 )
-            )
-            continue
+                continue
 
-        # Indeterminate — transport or server failure; fail open
-        logger.warning(
-            "Pre-flight validation unavailable — allowing symbol to proceed to fetch",
-            extra={"symbol": symbol, "reason": outcome.message},
-        )
-        valid.append(symbol)
+            # Indeterminate — transport or server failure; fail open
+            logger.warning(
+                "Pre-flight validation unavailable — allowing symbol to proceed to fetch",
+                extra={"symbol": symbol, "reason": outcome.message},
+            )
+            valid.append(symbol)
 
     return valid, prefailed
 
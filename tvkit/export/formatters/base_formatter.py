@@ -5,12 +5,16 @@ This module provides the abstract base class that all export formatters
 must implement, ensuring consistent interfaces across different formats.
 """
 
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
 
 from ..models import ExportConfig, ExportResult, OHLCVExportData, ScannerExportData
 
+# Default output directory for generated file paths, used when it exists.
+_EXPORT_DIR: Path = Path("export")
+
 
 class BaseFormatter(ABC):
     """Abstract base class for all data export formatters."""
@@ -91,15 +95,13 @@ class BaseFormatter(ABC):
         Returns:
             Generated file path
         """
-        from datetime import datetime
-
-        timestamp: str = datetime.now().strftime("%Y%m%d-%H%M%S")
+        # Local wall-clock time, formatted without building a datetime object
+        timestamp: str = time.strftime("%Y%m%d-%H%M%S")
         filename: str = f"{data_type}_{symbol}_{timestamp}.{extension}"
 
         # Use export directory if it exists, otherwise current directory
-        export_dir: Path = Path("export")
-        if export_dir.exists():
-            return export_dir / filename
+        if _EXPORT_DIR.exists():
+            return _EXPORT_DIR / filename
         return Path(filename)
 
     def _validate_data(self, data: list[Any]) -> None:
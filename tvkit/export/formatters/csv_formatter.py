@@ -5,9 +5,10 @@ This module provides CSV export functionality with configurable
 formatting options and metadata handling.
 """
 
+import asyncio
 import csv
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from pathlib import Path
 from typing import Any, Literal, cast
 
@@ -62,25 +63,10 @@ class CSVFormatter(BaseFormatter):
             if any(item.interval for item in data):
                 columns.append("interval")
 
-            # Convert data to rows
-            rows: list[dict[str, Any]] = []
-            for item in data:
-                row: dict[str, Any] = {
-                    "timestamp": self._prepare_timestamp(item.timestamp),
-                    "open": float(item.open),
-                    "high": float(item.high),
-                    "low": float(item.low),
-                    "close": float(item.close),
-                    "volume": float(item.volume),
-                }
-
-                # Add optional fields if present
-                if "symbol" in columns:
-                    row["symbol"] = item.symbol or ""
-                if "interval" in columns:
-                    row["interval"] = item.interval or ""
-
-                rows.append(row)
+            # Rows are produced lazily, in column order, while the file is written
+            rows: Iterator[list[Any]] = self._ohlcv_rows(
+                data, "symbol" in columns, "interval" in columns
+            )
 
             # Write CSV file
             await self._write_csv_file(rows, columns, file_path)
@@ -148,24 +134,24 @@ class CSVFormatter(BaseFormatter):
             # Sort columns for consistent output
             columns: list[str] = sorted(all_columns)
 
-            # Convert data to rows
-            rows: list[dict[str, Any]] = []
+            # Convert data to rows in column order
+            scanner_rows: list[list[Any]] = []
             for item in data:
-                row: dict[str, Any] = {"name": item.name}
+                row: list[Any] = []
 
                 # Add all data fields
                 for col in columns:
                     if col == "name":
-                        continue
+                        row.append(item.name)
                     elif col == "export_timestamp" and self.config.include_metadata:
-                        row[col] = item.export_timestamp.isoformat()
+                        row.append(item.export_timestamp.isoformat())
                     else:
-                        row[col] = item.data.get(col, "")
+                        row.append(item.data.get(col, ""))
 
-                rows.append(row)
+                scanner_rows.append(row)
 
             # Write CSV file
-            await self._write_csv_file(rows, columns, file_path)
+            await self._write_csv_file(scanner_rows, columns, file_path)
 
             # Write metadata file if configured
             if self.config.include_metadata:
@@ -193,14 +179,46 @@ class CSVFormatter(BaseFormatter):
 
             return ExportResult(success=False, metadata=metadata, error_message=str(e))
 
+    def _ohlcv_rows(
+        self, data: list[OHLCVExportData], include_symbol: bool, include_interval: bool
+    ) -> Iterator[list[Any]]:
+        """
+        Yield one CSV row per OHLCV record, in column order.
+
+        Args:
+            data: OHLCV data records
+            include_symbol: Append the symbol column ("" when a record has none)
+            include_interval: Append the interval column ("" when a record has none)
+
+        Returns:
+            Iterator of row value lists
+        """
+        for item in data:
+            row: list[Any] = [
+                self._prepare_timestamp(item.timestamp),
+                float(item.open),
+                float(item.high),
+                float(item.low),
+                float(item.close),
+                float(item.volume),
+            ]
+
+            # Add optional fields if present
+            if include_symbol:
+                row.append(item.symbol or "")
+            if include_interval:
+                row.append(item.interval or "")
+
+            yield row
+
     async def _write_csv_file(
-        self, rows: list[dict[str, Any]], columns: list[str], file_path: Path
+        self, rows: Iterable[Sequence[Any]], columns: list[str], file_path: Path
     ) -> None:
         """
         Write CSV data to file.
 
         Args:
-            rows: Data rows to write
+            rows: Data rows to write, each with values in ``columns`` order
             columns: Column names in order
             file_path: Output file path
 
@@ -218,21 +236,23 @@ class CSVFormatter(BaseFormatter):
         )
         line_terminator: str = self.config.options.get("line_terminator", "\n")
 
-        # Write CSV file
-        with open(file_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=columns,
-                delimiter=delimiter,
-                quoting=quoting,
-                lineterminator=line_terminator,
-            )
+        def write_rows() -> None:
+            with open(file_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(
+                    f,
+                    delimiter=delimiter,
+                    quoting=quoting,
+                    lineterminator=line_terminator,
+                )
+
+                # Write header
+                writer.writerow(columns)
 
-            # Write header
-            writer.writeheader()
+                # Write data rows
+                writer.writerows(rows)
 
-            # Write data rows
-            writer.writerows(rows)
+        # Write CSV file in a worker thread so the event loop stays free
+        await asyncio.to_thread(write_rows)
 
         logger.info(f"Successfully exported CSV data to {file_path}")
 
@@ -307,8 +327,7 @@ Each row represents one symbol with its associated data fields.
 """
 
             # Write metadata file
-            with open(metadata_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            await asyncio.to_thread(metadata_path.write_text, content, encoding="utf-8")
 
             logger.info(f"Metadata written to {metadata_path}")
 
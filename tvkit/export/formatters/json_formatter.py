@@ -5,10 +5,12 @@ This module provides JSON export functionality with configurable
 formatting and metadata inclusion options.
 """
 
+import asyncio
 import json
 import logging
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ..models import (
     ExportFormat,
@@ -19,9 +21,89 @@ from ..models import (
 )
 from .base_formatter import BaseFormatter
 
+if TYPE_CHECKING:
+    import orjson
+else:
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _orjson_dumps(
+    data: Any, indent: int | None, ensure_ascii: bool, sort_keys: bool
+) -> bytes | None:
+    """
+    Serialize export data with ``orjson``, or return None when it cannot be used.
+
+    ``orjson`` only indents by two spaces and always writes UTF-8, so it is
+    skipped when it is not installed, for other ``indent`` values and for
+    ``ensure_ascii=True``, and it gives up on values it rejects (integers wider
+    than 64 bits). Datetimes and dataclasses are passed to ``default=str`` as
+    the standard library does, so the output matches ``json.dump`` apart from
+    insignificant whitespace.
+
+    Args:
+        data: JSON-serializable data; other objects are written as ``str(obj)``.
+        indent: Indentation width, or None for compact output.
+        ensure_ascii: Escape all non-ASCII characters.
+        sort_keys: Sort object keys.
+
+    Returns:
+        The encoded JSON document, or None if the standard library must be used.
+    """
+    if orjson is None or indent not in (None, 2) or ensure_ascii:
+        return None
+    option: int = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if indent == 2:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    try:
+        return orjson.dumps(data, default=str, option=option)
+    except orjson.JSONEncodeError:
+        return None
+
+
+def _stdlib_encoder(indent: int | None, ensure_ascii: bool, sort_keys: bool) -> json.JSONEncoder:
+    """
+    Return the standard library encoder for the given formatting options.
+
+    Compact output (``indent=None``) omits the spaces after item and key
+    separators, matching ``orjson``.
+    """
+    return json.JSONEncoder(
+        indent=indent,
+        separators=(",", ":") if indent is None else None,
+        ensure_ascii=ensure_ascii,
+        sort_keys=sort_keys,
+        default=str,  # Handle any non-serializable objects
+    )
+
+
+def _dumps_json(data: Any, indent: int | None, ensure_ascii: bool, sort_keys: bool) -> bytes:
+    """
+    Serialize export data to UTF-8 JSON, using ``orjson`` when it is installed.
+
+    Falls back to the standard library whenever ``_orjson_dumps`` cannot be used.
+
+    Args:
+        data: JSON-serializable data; other objects are written as ``str(obj)``.
+        indent: Indentation width, or None for compact output.
+        ensure_ascii: Escape all non-ASCII characters.
+        sort_keys: Sort object keys.
+
+    Returns:
+        The encoded JSON document.
+    """
+    encoded: bytes | None = _orjson_dumps(data, indent, ensure_ascii, sort_keys)
+    if encoded is not None:
+        return encoded
+    return _stdlib_encoder(indent, ensure_ascii, sort_keys).encode(data).encode("utf-8")
+
+
 class JSONFormatter(BaseFormatter):
     """JSON export formatter with configurable options."""
 
@@ -52,10 +134,9 @@ class JSONFormatter(BaseFormatter):
             else:
                 file_path = Path(file_path)
 
-            # Convert data to JSON-serializable format
-            json_data: dict[str, Any] = {
-                "data": [self._convert_ohlcv_to_dict(item) for item in data]
-            }
+            # Records are converted and encoded one at a time while writing
+            records: Iterator[dict[str, Any]] = (self._convert_ohlcv_to_dict(item) for item in data)
+            extra: dict[str, Any] = {}
 
             # Add metadata if configured
             if self.config.include_metadata:
@@ -68,10 +149,10 @@ class JSONFormatter(BaseFormatter):
                     format=ExportFormat.JSON,
                     file_path=str(file_path),
                 )
-                json_data["metadata"] = metadata.model_dump()
+                extra["metadata"] = metadata.model_dump()
 
             # Write to file
-            await self._write_json_file(json_data, file_path)
+            await self._write_json_records(records, extra, file_path)
 
             # Create successful result
             metadata = ExportMetadata(
@@ -226,16 +307,79 @@ class JSONFormatter(BaseFormatter):
         ensure_ascii: bool = self.config.options.get("ensure_ascii", False)
         sort_keys: bool = self.config.options.get("sort_keys", True)
 
-        # Write to file
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(
-                data,
-                f,
-                indent=indent,
-                ensure_ascii=ensure_ascii,
-                sort_keys=sort_keys,
-                default=str,  # Handle any non-serializable objects
-            )
+        def write_document() -> None:
+            # With orjson, encode once and write the whole document in a single call
+            encoded: bytes | None = _orjson_dumps(data, indent, ensure_ascii, sort_keys)
+            if encoded is not None:
+                file_path.write_bytes(encoded)
+                return
+
+            encoder: json.JSONEncoder = _stdlib_encoder(indent, ensure_ascii, sort_keys)
+            with open(file_path, "w", encoding="utf-8") as f:
+                if indent is None:
+                    # Compact output only uses the C encoder when encoding in one shot
+                    f.write(encoder.encode(data))
+                else:
+                    # Indented output is encoded in Python either way; writing the
+                    # chunks as they are produced avoids holding the whole document
+                    f.writelines(encoder.iterencode(data))
+
+        # Encoding and writing run in a worker thread so the event loop stays free
+        await asyncio.to_thread(write_document)
+
+        logger.info(f"Successfully exported JSON data to {file_path}")
+
+    async def _write_json_records(
+        self, records: Iterable[dict[str, Any]], extra: dict[str, Any], file_path: Path
+    ) -> None:
+        """
+        Write ``{"data": [...records], **extra}`` to file, encoding one record at a time.
+
+        Produces the same document as ``_write_json_file`` without first building
+        the full list of records or the encoded document in memory. Records are
+        re-indented to their nesting level, so the layout matches as well.
+
+        Args:
+            records: Records for the ``data`` array, consumed lazily
+            extra: Further top-level keys written after ``data`` (e.g. metadata)
+            file_path: Output file path
+
+        Raises:
+            IOError: If file write fails
+        """
+        # Ensure parent directory exists
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Get formatting options
+        indent: int | None = self.config.options.get("indent", 2)
+        ensure_ascii: bool = self.config.options.get("ensure_ascii", False)
+        sort_keys: bool = self.config.options.get("sort_keys", True)
+
+        def encode(value: Any, depth: int) -> bytes:
+            encoded: bytes = _dumps_json(value, indent, ensure_ascii, sort_keys)
+            if indent is None:
+                return encoded
+            return encoded.replace(b"\n", b"\n" + b" " * (indent * depth))
+
+        # Separators and line breaks of the whole-document encoding for the configured indent
+        open_line: bytes = b"" if indent is None else b"\n" + b" " * indent
+        item_line: bytes = b"" if indent is None else b"\n" + b" " * (indent * 2)
+        key_sep: bytes = b":" if indent is None else b": "
+
+        def write_records() -> None:
+            with open(file_path, "wb") as f:
+                f.write(b"{" + open_line + encode("data", 1) + key_sep + b"[")
+                first: bool = True
+                for record in records:
+                    f.write((item_line if first else b"," + item_line) + encode(record, 2))
+                    first = False
+                f.write(b"]" if first else open_line + b"]")
+                for key, value in extra.items():
+                    f.write(b"," + open_line + encode(key, 1) + key_sep + encode(value, 1))
+                f.write((b"" if indent is None else b"\n") + b"}")
+
+        # Encoding and writing run in a worker thread so the event loop stays free
+        await asyncio.to_thread(write_records)
 
         logger.info(f"Successfully exported JSON data to {file_path}")
 
@@ -5,6 +5,7 @@ This module provides export functionality using Polars DataFrames,
 offering high-performance data processing and analysis capabilities.
 """
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -268,12 +269,13 @@ class PolarsFormatter(BaseFormatter):
             path: Path = Path(file_path)
             path.parent.mkdir(parents=True, exist_ok=True)
 
+            # Polars writers block (and release the GIL), so run them in a worker thread
             if format_type.lower() == "parquet":
-                df.write_parquet(path)
+                await asyncio.to_thread(df.write_parquet, path)
             elif format_type.lower() == "csv":
-                df.write_csv(path)
+                await asyncio.to_thread(df.write_csv, path)
             elif format_type.lower() == "json":
-                df.write_json(path)
+                await asyncio.to_thread(df.write_json, path)
             else:
                 raise ValueError(f"Unsupported file format: {format_type}")
 